@@ -1,9 +1,12 @@
 """Agent implementations for document processing."""
 
-from idp.agents.base import AgentProtocol, AgentResult, BaseAgent
+from idp.agents.base import AgentProtocol, AgentResult, BaseAgent, CachingAgent
+from idp.agents.cache import AgentCache
 
 __all__ = [
     "BaseAgent",
+    "CachingAgent",
     "AgentProtocol",
     "AgentResult",
+    "AgentCache",
 ]
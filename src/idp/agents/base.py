@@ -1,9 +1,14 @@
 """Base agent definitions and protocols."""
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Generic, Protocol, TypeVar, runtime_checkable
 
+from pydantic import ValidationError as PydanticValidationError
+
+from idp.agents.cache import AgentCache
 from idp.core.config import Settings, get_settings
 from idp.core.exceptions import AgentError
 from idp.core.logging import get_logger
@@ -92,21 +97,46 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         """Execute the agent logic. Implemented by subclasses."""
         ...
 
+    async def _cache_lookup(
+        self,
+        input_data: InputT,  # noqa: ARG002
+    ) -> tuple[str | None, AgentResult[OutputT] | None]:
+        """Look an input up in the output cache.
+
+        Agents without a cache never hit; see ``CachingAgent``.
+
+        Returns:
+            The input's cache key (None if the output can't be cached) and a
+            successful result if the output was cached
+        """
+        return None, None
+
+    async def _cache_store(
+        self,
+        cache_key: str | None,  # noqa: ARG002
+        output: OutputT,  # noqa: ARG002
+    ) -> None:
+        """Store an output in the cache under a key from ``_cache_lookup``."""
+
     async def process(self, input_data: InputT) -> AgentResult[OutputT]:
         """Process input with retry and error handling."""
-        import time
-
         start_time = time.perf_counter()
         metrics: dict[str, Any] = {"agent": self.name}
 
         self._logger.info("Starting agent execution", agent=self.name)
 
+        cache_key, cached = await self._cache_lookup(input_data)
+        if cached is not None:
+            return cached
+
         try:
             output = await retry_async(
                 lambda: self._execute(input_data),
                 self._retry_config,
             )
 
+            await self._cache_store(cache_key, output)
+
             duration_ms = (time.perf_counter() - start_time) * 1000
             metrics["duration_ms"] = duration_ms
             metrics["success"] = True
@@ -137,3 +167,97 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
                 agent_name=self.name,
                 details={"error": str(e), "metrics": metrics},
             ) from e
+
+
+class CachingAgent(BaseAgent[InputT, OutputT]):
+    """Base class for agents whose outputs are kept in an ``AgentCache``.
+
+    Subclasses define how inputs are keyed and how outputs round-trip
+    through the cache. Cache files are read and written in worker threads
+    so lookups don't block the event loop.
+    """
+
+    def __init__(
+        self,
+        llm_client: BaseLLMClient,
+        settings: Settings | None = None,
+        retry_config: RetryConfig | None = None,
+        cache: AgentCache | None = None,
+    ) -> None:
+        """Initialize the agent.
+
+        Args:
+            llm_client: LLM client for generating responses
+            settings: Application settings
+            retry_config: Retry configuration
+            cache: Output cache (defaults to one under settings.agent_cache_dir, if set)
+        """
+        super().__init__(llm_client, settings, retry_config)
+        if cache is None and self._settings.agent_cache_dir:
+            cache = AgentCache(self._settings.agent_cache_dir)
+        self._cache = cache
+
+    @abstractmethod
+    def _cache_key(self, input_data: InputT) -> str | None:
+        """Get the cache key for an input, or None if the output can't be cached."""
+        ...
+
+    @abstractmethod
+    def _cache_dump(self, output: OutputT) -> dict[str, Any]:
+        """Serialize an output for the cache."""
+        ...
+
+    @abstractmethod
+    def _cache_load(self, payload: dict[str, Any]) -> OutputT:
+        """Rebuild an output from a cached payload."""
+        ...
+
+    async def _load_cached(self, key: str) -> OutputT | None:
+        """Load and revalidate a cached output, evicting it if it's stale."""
+        if self._cache is None:
+            return None
+        payload = await asyncio.to_thread(self._cache.get, self.name, key)
+        if payload is None:
+            return None
+        try:
+            return self._cache_load(payload)
+        except (PydanticValidationError, KeyError, TypeError, ValueError) as e:
+            self._logger.warning("Evicting invalid cache entry", agent=self.name, error=str(e))
+            await asyncio.to_thread(self._cache.evict, self.name, key)
+            return None
+
+    async def _cache_lookup(
+        self,
+        input_data: InputT,
+    ) -> tuple[str | None, AgentResult[OutputT] | None]:
+        """Look an input up in the output cache."""
+        if self._cache is None:
+            return None, None
+        start_time = time.perf_counter()
+        cache_key = self._cache_key(input_data)
+        if cache_key is None:
+            return None, None
+        cached = await self._load_cached(cache_key)
+        if cached is None:
+            return cache_key, None
+
+        self._logger.info("Agent output served from cache", agent=self.name)
+        metrics = {
+            "agent": self.name,
+            "duration_ms": (time.perf_counter() - start_time) * 1000,
+            "success": True,
+            "cache_hit": True,
+        }
+        return cache_key, AgentResult.success_result(cached, metrics)
+
+    async def _cache_store(self, cache_key: str | None, output: OutputT) -> None:
+        """Store an output in the cache under a key from ``_cache_lookup``."""
+        if cache_key is None or self._cache is None:
+            return
+        await asyncio.to_thread(
+            self._cache.put,
+            self.name,
+            cache_key,
+            self._cache_dump(output),
+            config={"model": self._llm_client.model_id},
+        )
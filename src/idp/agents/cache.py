@@ -0,0 +1,108 @@
+"""Content-addressable cache for agent outputs."""
+
+import hashlib
+import json
+import os
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from idp.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def content_hash(*parts: str) -> str:
+    """Hash a sequence of strings into a stable hex digest.
+
+    Each part is length-prefixed so that ``("ab", "c")`` and ``("a", "bc")``
+    produce different keys.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class AgentCache:
+    """On-disk cache of agent outputs keyed by a content hash.
+
+    Entries are stored as ``<cache_dir>/<namespace>/<key>.json`` with the
+    configuration that produced them and the time they were written.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+        """
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_path(self, namespace: str, key: str) -> Path:
+        """Get the file path for a cache entry."""
+        return self._cache_dir / namespace / f"{key}.json"
+
+    def get(self, namespace: str, key: str) -> dict[str, Any] | None:
+        """Look up a cached output.
+
+        Args:
+            namespace: Cache namespace (usually the agent name)
+            key: Content hash of the agent input
+
+        Returns:
+            Cached output payload if present, None otherwise
+        """
+        path = self._get_path(namespace, key)
+        try:
+            entry = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Discarding unreadable cache entry", path=str(path), error=str(e))
+            self.evict(namespace, key)
+            return None
+
+        output = entry.get("output")
+        return output if isinstance(output, dict) else None
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        output: dict[str, Any],
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        """Store an output in the cache.
+
+        Args:
+            namespace: Cache namespace (usually the agent name)
+            key: Content hash of the agent input
+            output: JSON-serializable output payload
+            config: Configuration that produced the output
+        """
+        path = self._get_path(namespace, key)
+        entry = {
+            "config": config or {},
+            "output": output,
+            "cached_at": datetime.now(UTC).isoformat(),
+        }
+        # Write to a unique temp file and rename, so concurrent readers never
+        # see a partial entry
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry, default=str))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            # A cache write failure must never fail the agent
+            logger.warning("Failed to write cache entry", path=str(path), error=str(e))
+
+    def evict(self, namespace: str, key: str) -> None:
+        """Remove a cache entry if it exists."""
+        self._get_path(namespace, key).unlink(missing_ok=True)
@@ -1,20 +1,30 @@
 """Classification agent implementation."""
 
 import json
+import time
+from typing import Any
 
-from idp.agents.base import BaseAgent
+from idp.agents.base import AgentResult, CachingAgent
+from idp.agents.cache import content_hash
 from idp.agents.classification.models import ClassificationInput, ClassificationOutput
 from idp.agents.classification.prompts import (
+    CLASSIFICATION_BATCH_DOCUMENT_TEMPLATE,
+    CLASSIFICATION_BATCH_JSON_SCHEMA,
+    CLASSIFICATION_BATCH_USER_PROMPT_TEMPLATE,
     CLASSIFICATION_JSON_SCHEMA,
     CLASSIFICATION_SYSTEM_PROMPT,
     CLASSIFICATION_USER_PROMPT_TEMPLATE,
 )
 from idp.core.exceptions import LLMError
+from idp.core.retry import retry_async
 from idp.llm.client import LLMMessage, MessageRole
 from idp.models.document import DocumentType
 
+# Map raw LLM labels to enum members without going through enum lookup/ValueError
+_DOC_TYPE_LOOKUP: dict[str, DocumentType] = {dt.value: dt for dt in DocumentType}
 
-class ClassificationAgent(BaseAgent[ClassificationInput, ClassificationOutput]):
+
+class ClassificationAgent(CachingAgent[ClassificationInput, ClassificationOutput]):
     """Agent for classifying document types."""
 
     @property
@@ -32,6 +42,25 @@ class ClassificationAgent(BaseAgent[ClassificationInput, ClassificationOutput]):
 
         return "\n\n".join(text_parts), len(pages)
 
+    def _cache_key(self, input_data: ClassificationInput) -> str | None:
+        """Key the cache on model, prompts, and the text sent for classification."""
+        document_text, _ = self._get_document_text(input_data)
+        return content_hash(
+            self._llm_client.model_id,
+            CLASSIFICATION_SYSTEM_PROMPT,
+            CLASSIFICATION_USER_PROMPT_TEMPLATE,
+            json.dumps(CLASSIFICATION_JSON_SCHEMA, sort_keys=True),
+            document_text,
+        )
+
+    def _cache_dump(self, output: ClassificationOutput) -> dict[str, Any]:
+        """Serialize a classification for the cache."""
+        return output.model_dump(mode="json")
+
+    def _cache_load(self, payload: dict[str, Any]) -> ClassificationOutput:
+        """Rebuild a classification from the cache."""
+        return ClassificationOutput.model_validate(payload)
+
     async def _execute(self, input_data: ClassificationInput) -> ClassificationOutput:
         """Execute the classification."""
         document_text, analyzed_pages = self._get_document_text(input_data)
@@ -63,18 +92,20 @@ class ClassificationAgent(BaseAgent[ClassificationInput, ClassificationOutput]):
 
         # Parse response
         try:
-            result = json.loads(response.content)
+            result = response.data
         except json.JSONDecodeError as e:
             raise LLMError(
                 "Failed to parse classification response",
                 details={"content": response.content, "error": str(e)},
             ) from e
 
-        # Map to DocumentType
-        doc_type_str = result.get("document_type", "unknown").lower()
-        try:
-            document_type = DocumentType(doc_type_str)
-        except ValueError:
+        return self._build_output(result, analyzed_pages)
+
+    def _build_output(self, result: dict[str, Any], analyzed_pages: int) -> ClassificationOutput:
+        """Map a raw classification response to a typed output."""
+        doc_type_str = str(result.get("document_type", "unknown")).lower()
+        document_type = _DOC_TYPE_LOOKUP.get(doc_type_str)
+        if document_type is None:
             self._logger.warning(
                 "Unknown document type returned",
                 document_type=doc_type_str,
@@ -87,3 +118,117 @@ class ClassificationAgent(BaseAgent[ClassificationInput, ClassificationOutput]):
             reasoning=result.get("reasoning", "No reasoning provided"),
             analyzed_pages=analyzed_pages,
         )
+
+    async def process_many(
+        self,
+        inputs: list[ClassificationInput],
+        batch_size: int = 8,
+    ) -> list[AgentResult[ClassificationOutput]]:
+        """Classify several documents, sharing one LLM request per slice.
+
+        Cached documents are served from the output cache, as in ``process``.
+        The rest are grouped into slices of ``batch_size`` and each slice is sent
+        as a single multi-document prompt. Any document the batched response
+        doesn't cover (or a slice whose request fails) falls back to a regular
+        per-document ``process`` call.
+
+        Args:
+            inputs: Classification inputs
+            batch_size: Maximum documents per LLM request
+
+        Returns:
+            Results in the same order as ``inputs``
+        """
+        results: list[AgentResult[ClassificationOutput] | None] = [None] * len(inputs)
+        # Serve cached documents first so only misses are sent to the LLM
+        misses: list[int] = []
+        cache_keys: list[str | None] = []
+        for i, input_data in enumerate(inputs):
+            cache_key, cached = await self._cache_lookup(input_data)
+            if cached is None:
+                misses.append(i)
+                cache_keys.append(cache_key)
+            else:
+                results[i] = cached
+
+        for start in range(0, len(misses), batch_size):
+            indices = misses[start : start + batch_size]
+            slice_results = await self._process_slice(
+                [inputs[i] for i in indices],
+                cache_keys[start : start + batch_size],
+            )
+            for i, result in zip(indices, slice_results, strict=True):
+                results[i] = result
+        return [result for result in results if result is not None]
+
+    async def _process_slice(
+        self,
+        inputs: list[ClassificationInput],
+        cache_keys: list[str | None],
+    ) -> list[AgentResult[ClassificationOutput]]:
+        """Classify one slice of documents with a single LLM request."""
+        if len(inputs) <= 1:
+            return [await self.process(input_data) for input_data in inputs]
+
+        start_time = time.perf_counter()
+        texts = [self._get_document_text(input_data) for input_data in inputs]
+        documents = "\n\n".join(
+            CLASSIFICATION_BATCH_DOCUMENT_TEMPLATE.format(index=i, document_text=text)
+            for i, (text, _) in enumerate(texts)
+        )
+        messages = [
+            LLMMessage(
+                role=MessageRole.USER,
+                content=CLASSIFICATION_BATCH_USER_PROMPT_TEMPLATE.format(
+                    document_count=len(inputs),
+                    documents=documents,
+                ),
+            ),
+        ]
+
+        self._logger.debug("Classifying document batch", batch_size=len(inputs))
+
+        try:
+            response = await retry_async(
+                lambda: self._llm_client.generate_json(
+                    messages=messages,
+                    schema=CLASSIFICATION_BATCH_JSON_SCHEMA,
+                    system=CLASSIFICATION_SYSTEM_PROMPT,
+                    temperature=0.0,
+                ),
+                self._retry_config,
+            )
+            classifications = response.data["classifications"]
+            by_index = {int(c["index"]): c for c in classifications}
+        except Exception as e:
+            self._logger.warning(
+                "Batched classification failed, falling back to per-document calls",
+                batch_size=len(inputs),
+                error=str(e),
+            )
+            return [await self.process(input_data) for input_data in inputs]
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        results: list[AgentResult[ClassificationOutput]] = []
+        for i, input_data in enumerate(inputs):
+            classification = by_index.get(i)
+            try:
+                if classification is None:
+                    raise KeyError(i)
+                output = self._build_output(classification, texts[i][1])
+            except Exception:
+                results.append(await self.process(input_data))
+                continue
+            await self._cache_store(cache_keys[i], output)
+            results.append(
+                AgentResult.success_result(
+                    output,
+                    {
+                        "agent": self.name,
+                        "duration_ms": duration_ms,
+                        "success": True,
+                        "batch_size": len(inputs),
+                    },
+                )
+            )
+        return results
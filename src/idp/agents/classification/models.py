@@ -1,18 +1,19 @@
 """Classification agent data models."""
 
+from dataclasses import dataclass
+
 from pydantic import BaseModel, Field
 
 from idp.models.document import Document, DocumentType
 
 
-class ClassificationInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ClassificationInput:
     """Input for the classification agent."""
 
     document: Document
-    max_pages: int = Field(
-        default=3,
-        description="Maximum number of pages to analyze for classification",
-    )
+    # Maximum number of pages to analyze for classification
+    max_pages: int = 3
 
 
 class ClassificationOutput(BaseModel):
@@ -1,5 +1,7 @@
 """Prompt templates for classification agent."""
 
+from typing import Any
+
 CLASSIFICATION_SYSTEM_PROMPT = """You are a document classification expert. Your task is to analyze documents and classify them into one of the following categories:
 
 1. **invoice** - Commercial documents requesting payment for goods or services. Contains invoice number, line items, totals, vendor/customer information.
@@ -22,7 +24,7 @@ CLASSIFICATION_USER_PROMPT_TEMPLATE = """Please classify the following document:
 
 Analyze the document and provide your classification."""
 
-CLASSIFICATION_JSON_SCHEMA = {
+CLASSIFICATION_JSON_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
         "document_type": {
@@ -43,3 +45,33 @@ CLASSIFICATION_JSON_SCHEMA = {
     },
     "required": ["document_type", "confidence", "reasoning"],
 }
+
+CLASSIFICATION_BATCH_USER_PROMPT_TEMPLATE = """Please classify each of the following {document_count} documents independently. Each document starts with a "=== Document N ===" header.
+
+{documents}
+
+Analyze each document and provide one classification per document, using the document's index N."""
+
+CLASSIFICATION_BATCH_DOCUMENT_TEMPLATE = """=== Document {index} ===
+{document_text}"""
+
+CLASSIFICATION_BATCH_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "classifications": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {
+                        "type": "integer",
+                        "description": "Index N of the document from its header",
+                    },
+                    **CLASSIFICATION_JSON_SCHEMA["properties"],
+                },
+                "required": ["index", "document_type", "confidence", "reasoning"],
+            },
+        },
+    },
+    "required": ["classifications"],
+}
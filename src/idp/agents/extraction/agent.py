@@ -1,13 +1,21 @@
 """Extraction agent implementation."""
 
+import asyncio
 import json
 from datetime import date
 from decimal import Decimal
 from typing import Any
 
-from idp.agents.base import BaseAgent
+from pydantic import ValidationError as PydanticValidationError
+
+from idp.agents.base import CachingAgent
+from idp.agents.cache import content_hash
 from idp.agents.extraction.models import ExtractionInput, ExtractionOutput
-from idp.agents.extraction.prompts import EXTRACTION_USER_PROMPT_TEMPLATE, get_extraction_prompt
+from idp.agents.extraction.prompts import (
+    EXTRACTION_FEEDBACK_PROMPT_TEMPLATE,
+    EXTRACTION_USER_PROMPT_TEMPLATE,
+    get_extraction_prompt,
+)
 from idp.agents.extraction.schemas import get_schema_for_document_type
 from idp.core.exceptions import LLMError
 from idp.llm.client import LLMMessage, MessageRole
@@ -23,7 +31,7 @@ from idp.models.extraction import (
 )
 
 
-class ExtractionAgent(BaseAgent[ExtractionInput, ExtractionOutput]):
+class ExtractionAgent(CachingAgent[ExtractionInput, ExtractionOutput]):
     """Agent for extracting structured data from documents."""
 
     @property
@@ -166,6 +174,52 @@ class ExtractionAgent(BaseAgent[ExtractionInput, ExtractionOutput]):
             raw_fields=data,
         )
 
+    def _build_output(
+        self,
+        doc_type: DocumentType,
+        raw_data: dict[str, Any],
+    ) -> ExtractionOutput:
+        """Build typed extraction output based on document type."""
+        if doc_type == DocumentType.INVOICE:
+            invoice = self._build_invoice_extraction(raw_data)
+            return ExtractionOutput.from_invoice(invoice, raw_data)
+        elif doc_type == DocumentType.RECEIPT:
+            receipt = self._build_receipt_extraction(raw_data)
+            return ExtractionOutput.from_receipt(receipt, raw_data)
+        elif doc_type == DocumentType.CONTRACT:
+            contract = self._build_contract_extraction(raw_data)
+            return ExtractionOutput.from_contract(contract, raw_data)
+        else:
+            form = self._build_form_extraction(raw_data)
+            return ExtractionOutput.from_form(form, raw_data)
+
+    def _cache_key(self, input_data: ExtractionInput) -> str | None:
+        """Key the cache on model, document type, prompts, schema, and document text."""
+        doc_type = input_data.document_type
+        schema = input_data.custom_schema or get_schema_for_document_type(doc_type)
+        return content_hash(
+            self._llm_client.model_id,
+            doc_type.value,
+            get_extraction_prompt(doc_type),
+            EXTRACTION_USER_PROMPT_TEMPLATE,
+            json.dumps(schema, sort_keys=True),
+            input_data.document.full_text,
+        )
+
+    def _cache_dump(self, output: ExtractionOutput) -> dict[str, Any]:
+        """Serialize an extraction for the cache as the raw LLM payload."""
+        return {
+            "document_type": output.document_type.value,
+            "raw_response": output.raw_response,
+        }
+
+    def _cache_load(self, payload: dict[str, Any]) -> ExtractionOutput:
+        """Rebuild and revalidate an extraction from the cache."""
+        return self._build_output(
+            DocumentType(payload["document_type"]),
+            payload["raw_response"],
+        )
+
     async def _execute(self, input_data: ExtractionInput) -> ExtractionOutput:
         """Execute the extraction."""
         document = input_data.document
@@ -192,33 +246,40 @@ class ExtractionAgent(BaseAgent[ExtractionInput, ExtractionOutput]):
             ),
         ]
 
-        # Get extraction from LLM
-        response = await self._llm_client.generate_json(
-            messages=messages,
-            schema=schema,
-            system=get_extraction_prompt(doc_type),
-            temperature=0.0,
-        )
+        # Re-prompt with the error instead of failing the whole document
+        max_retries = self._settings.feedback_max_retries
+        attempt = 0
+        while True:
+            response = await self._llm_client.generate_json(
+                messages=messages,
+                schema=schema,
+                system=get_extraction_prompt(doc_type),
+                temperature=0.0,
+            )
 
-        # Parse response
-        try:
-            raw_data = json.loads(response.content)
-        except json.JSONDecodeError as e:
-            raise LLMError(
-                "Failed to parse extraction response",
-                details={"content": response.content, "error": str(e)},
-            ) from e
-
-        # Build typed extraction based on document type
-        if doc_type == DocumentType.INVOICE:
-            extraction = self._build_invoice_extraction(raw_data)
-            return ExtractionOutput.from_invoice(extraction, raw_data)
-        elif doc_type == DocumentType.RECEIPT:
-            extraction = self._build_receipt_extraction(raw_data)
-            return ExtractionOutput.from_receipt(extraction, raw_data)
-        elif doc_type == DocumentType.CONTRACT:
-            extraction = self._build_contract_extraction(raw_data)
-            return ExtractionOutput.from_contract(extraction, raw_data)
-        else:
-            extraction = self._build_form_extraction(raw_data)
-            return ExtractionOutput.from_form(extraction, raw_data)
+            try:
+                raw_data = response.data
+                return self._build_output(doc_type, raw_data)
+            except (json.JSONDecodeError, PydanticValidationError, AttributeError, TypeError) as e:
+                if attempt == max_retries:
+                    raise LLMError(
+                        "Failed to parse extraction response",
+                        details={"content": response.content, "error": str(e)},
+                    ) from e
+
+                self._logger.warning(
+                    "Invalid extraction response, retrying with feedback",
+                    document_id=document.id,
+                    attempt=attempt + 1,
+                    error=str(e),
+                )
+                messages = [
+                    *messages,
+                    LLMMessage(role=MessageRole.ASSISTANT, content=response.content),
+                    LLMMessage(
+                        role=MessageRole.USER,
+                        content=EXTRACTION_FEEDBACK_PROMPT_TEMPLATE.format(error=e),
+                    ),
+                ]
+                await asyncio.sleep(self._settings.retry_base_delay * (attempt + 1))
+                attempt += 1
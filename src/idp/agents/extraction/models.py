@@ -1,5 +1,6 @@
 """Extraction agent data models."""
 
+from dataclasses import dataclass
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -14,15 +15,14 @@ from idp.models.extraction import (
 )
 
 
-class ExtractionInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ExtractionInput:
     """Input for the extraction agent."""
 
     document: Document
     document_type: DocumentType
-    custom_schema: dict[str, Any] | None = Field(
-        default=None,
-        description="Optional custom schema for extraction (overrides default)",
-    )
+    # Optional custom schema for extraction (overrides default)
+    custom_schema: dict[str, Any] | None = None
 
 
 class ExtractionOutput(BaseModel):
@@ -63,6 +63,10 @@ EXTRACTION_USER_PROMPT_TEMPLATE = """Extract structured data from the following
 
 Extract all relevant fields and return the data as JSON."""
 
+EXTRACTION_FEEDBACK_PROMPT_TEMPLATE = """Your output had error: {error}
+
+Fix the problem and return the corrected data as JSON."""
+
 
 def get_extraction_prompt(document_type: DocumentType) -> str:
     """Get the system prompt for a document type."""
@@ -1,14 +1,21 @@
 """Validation agent implementation."""
 
-from idp.agents.base import BaseAgent
+import asyncio
+import time
+from collections.abc import Sequence
+
+from idp.agents.base import AgentResult, BaseAgent
 from idp.agents.validation.models import (
     ValidationInput,
+    ValidationIssue,
     ValidationOutput,
 )
-from idp.agents.validation.rules import ValidationRuleRegistry
+from idp.agents.validation.rules import ValidationRule, ValidationRuleRegistry
 from idp.core.config import Settings
 from idp.core.retry import RetryConfig
 from idp.llm.client import BaseLLMClient
+from idp.models.document import DocumentType
+from idp.models.extraction import BaseExtraction
 
 
 class ValidationAgent(BaseAgent[ValidationInput, ValidationOutput]):
@@ -52,36 +59,35 @@ class ValidationAgent(BaseAgent[ValidationInput, ValidationOutput]):
 
         # Get applicable rules
         rules = self._registry.get_rules(document_type)
+        if not rules:
+            # Nothing to check: skip the rule loop
+            self._logger.debug("No validation rules apply", document_type=document_type.value)
+            return ValidationOutput(valid=True, rules_checked=0, rules_passed=0)
+
         output = ValidationOutput(
             valid=True,
             rules_checked=len(rules),
             rules_passed=0,
         )
 
-        # Run each rule
+        # Blocking rules run concurrently in worker threads, the rest inline
+        offloaded = [rule for rule in rules if rule.offload]
+        threaded = dict(
+            zip(
+                offloaded,
+                await asyncio.gather(
+                    *(asyncio.to_thread(self._run_rule, rule, extraction) for rule in offloaded)
+                ),
+                strict=True,
+            )
+        )
+
+        # Record results in rule order
         for rule in rules:
-            try:
-                issues = rule.validate(extraction)
-                if issues:
-                    for issue in issues:
-                        output.add_issue(issue)
-                else:
-                    output.rules_passed += 1
-            except Exception as e:
-                self._logger.warning(
-                    "Rule validation failed",
-                    rule=rule.name,
-                    error=str(e),
-                )
-                # Don't count failed rules as issues
-
-        # Determine overall validity
-        if input_data.strict_mode:
-            # In strict mode, warnings are also failures
-            output.valid = output.error_count == 0 and output.warning_count == 0
-        else:
-            # Normal mode: only errors cause failure
-            output.valid = output.error_count == 0
+            issues = threaded[rule] if rule.offload else self._run_rule(rule, extraction)
+            self._record(output, issues)
+
+        self._finalize(output, input_data.strict_mode)
 
         self._logger.info(
             "Validation completed",
@@ -92,3 +98,107 @@ class ValidationAgent(BaseAgent[ValidationInput, ValidationOutput]):
         )
 
         return output
+
+    async def process_many(
+        self,
+        inputs: list[ValidationInput],
+    ) -> list[AgentResult[ValidationOutput]]:
+        """Validate several extractions, running each rule over the whole batch.
+
+        Inputs are grouped by document type, so applicable rules are looked
+        up once per type, and each rule's ``validate_batch`` sees every
+        extraction of that type in one call.
+
+        Args:
+            inputs: Validation inputs
+
+        Returns:
+            Results in the same order as ``inputs``
+        """
+        start_time = time.perf_counter()
+        groups: dict[DocumentType, list[int]] = {}
+        for i, input_data in enumerate(inputs):
+            groups.setdefault(input_data.document_type, []).append(i)
+
+        outputs: list[ValidationOutput] = [
+            ValidationOutput(valid=True, rules_checked=0, rules_passed=0) for _ in inputs
+        ]
+        for document_type, indices in groups.items():
+            rules = self._registry.get_rules(document_type)
+            extractions = [inputs[i].extraction for i in indices]
+            for i in indices:
+                outputs[i].rules_checked = len(rules)
+            for rule in rules:
+                if rule.offload:
+                    batch = await asyncio.to_thread(self._run_rule_batch, rule, extractions)
+                else:
+                    batch = self._run_rule_batch(rule, extractions)
+                for i, issues in zip(indices, batch, strict=True):
+                    self._record(outputs[i], issues)
+
+        for input_data, output in zip(inputs, outputs, strict=True):
+            self._finalize(output, input_data.strict_mode)
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        self._logger.info(
+            "Batch validation completed",
+            batch_size=len(inputs),
+            invalid=sum(1 for output in outputs if not output.valid),
+            duration_ms=duration_ms,
+        )
+        metrics = {
+            "agent": self.name,
+            "duration_ms": duration_ms,
+            "success": True,
+            "batch_size": len(inputs),
+        }
+        return [AgentResult.success_result(output, dict(metrics)) for output in outputs]
+
+    def _run_rule(
+        self,
+        rule: ValidationRule,
+        extraction: BaseExtraction,
+    ) -> list[ValidationIssue] | None:
+        """Run one rule, returning None if the rule itself failed."""
+        try:
+            return rule.validate(extraction)
+        except Exception as e:
+            self._logger.warning(
+                "Rule validation failed",
+                rule=rule.name,
+                error=str(e),
+            )
+            return None
+
+    def _run_rule_batch(
+        self,
+        rule: ValidationRule,
+        extractions: Sequence[BaseExtraction],
+    ) -> list[list[ValidationIssue] | None]:
+        """Run one rule over a batch, isolating failures to the affected extraction."""
+        try:
+            return list(rule.validate_batch(extractions))
+        except Exception:
+            return [self._run_rule(rule, extraction) for extraction in extractions]
+
+    @staticmethod
+    def _record(output: ValidationOutput, issues: list[ValidationIssue] | None) -> None:
+        """Add a rule's issues to the output, counting it as passed if it found none."""
+        if issues is None:
+            # Don't count failed rules as issues
+            return
+        if issues:
+            for issue in issues:
+                output.add_issue(issue)
+        else:
+            output.rules_passed += 1
+
+    @staticmethod
+    def _finalize(output: ValidationOutput, strict_mode: bool) -> None:
+        """Determine overall validity from the recorded issues."""
+        if strict_mode:
+            # In strict mode, warnings are also failures
+            output.valid = output.error_count == 0 and output.warning_count == 0
+        else:
+            # Normal mode: only errors cause failure
+            output.valid = output.error_count == 0
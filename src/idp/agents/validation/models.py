@@ -1,8 +1,12 @@
 """Validation agent data models."""
 
+from collections import Counter
+from dataclasses import dataclass
 from enum import StrEnum
+from operator import attrgetter
 from typing import Any
 
+import pydantic_core
 from pydantic import BaseModel, Field
 
 from idp.models.document import Document, DocumentType
@@ -17,15 +21,25 @@ class IssueSeverity(StrEnum):
     INFO = "info"
 
 
-class ValidationIssue(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationIssue:
     """A validation issue found in the extracted data."""
 
-    field: str = Field(..., description="Field or path with the issue")
-    severity: IssueSeverity = Field(default=IssueSeverity.ERROR)
-    message: str = Field(..., description="Description of the issue")
-    rule: str = Field(..., description="Name of the validation rule that found the issue")
-    expected: Any = Field(default=None, description="Expected value or format")
-    actual: Any = Field(default=None, description="Actual value found")
+    # Field or path with the issue
+    field: str
+    # Description of the issue
+    message: str
+    # Name of the validation rule that found the issue
+    rule: str
+    severity: IssueSeverity = IssueSeverity.ERROR
+    # Expected value or format
+    expected: Any = None
+    # Actual value found
+    actual: Any = None
+
+    def __post_init__(self) -> None:
+        """Coerce a plain string severity, as the pydantic model did."""
+        object.__setattr__(self, "severity", IssueSeverity(self.severity))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -39,16 +53,15 @@ class ValidationIssue(BaseModel):
         }
 
 
-class ValidationInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationInput:
     """Input for the validation agent."""
 
     document: Document
     document_type: DocumentType
     extraction: BaseExtraction
-    strict_mode: bool = Field(
-        default=False,
-        description="If true, warnings are treated as errors",
-    )
+    # If true, warnings are treated as errors
+    strict_mode: bool = False
 
 
 class ValidationOutput(BaseModel):
@@ -59,20 +72,28 @@ class ValidationOutput(BaseModel):
     rules_checked: int = Field(default=0, description="Number of validation rules checked")
     rules_passed: int = Field(default=0, description="Number of rules that passed")
 
+    def _severity_counts(self) -> Counter[IssueSeverity]:
+        """Count issues per severity in one pass.
+
+        Recounted on every call: ``issues`` is a plain list that callers may
+        edit in place, so a cached count could go stale.
+        """
+        return Counter(map(attrgetter("severity"), self.issues))
+
     @property
     def error_count(self) -> int:
         """Count of error-level issues."""
-        return sum(1 for i in self.issues if i.severity == IssueSeverity.ERROR)
+        return self._severity_counts()[IssueSeverity.ERROR]
 
     @property
     def warning_count(self) -> int:
         """Count of warning-level issues."""
-        return sum(1 for i in self.issues if i.severity == IssueSeverity.WARNING)
+        return self._severity_counts()[IssueSeverity.WARNING]
 
     @property
     def info_count(self) -> int:
         """Count of info-level issues."""
-        return sum(1 for i in self.issues if i.severity == IssueSeverity.INFO)
+        return self._severity_counts()[IssueSeverity.INFO]
 
     def add_issue(self, issue: ValidationIssue) -> None:
         """Add a validation issue."""
@@ -84,12 +105,21 @@ class ValidationOutput(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        counts = self._severity_counts()
         return {
             "valid": self.valid,
-            "error_count": self.error_count,
-            "warning_count": self.warning_count,
-            "info_count": self.info_count,
+            "error_count": counts[IssueSeverity.ERROR],
+            "warning_count": counts[IssueSeverity.WARNING],
+            "info_count": counts[IssueSeverity.INFO],
             "rules_checked": self.rules_checked,
             "rules_passed": self.rules_passed,
             "issues": [i.to_dict() for i in self.issues],
         }
+
+    def to_json(self) -> bytes:
+        """Serialize ``to_dict()`` to JSON with pydantic-core's serializer.
+
+        Decimals and dates in issue values are encoded natively; anything
+        else unrecognized falls back to ``str``.
+        """
+        return pydantic_core.to_json(self.to_dict(), fallback=str)
@@ -2,21 +2,41 @@
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import date
 from decimal import Decimal
+from functools import partial
+from operator import attrgetter
 from typing import Any, TypeVar
 
 from idp.agents.validation.models import IssueSeverity, ValidationIssue
 from idp.models.document import DocumentType
 from idp.models.extraction import (
     BaseExtraction,
+    LineItem,
 )
 
 T = TypeVar("T", bound=BaseExtraction)
 
+# Allowed difference between amounts that should add up
+_AMOUNT_TOLERANCE = Decimal("0.01")
+
+
+def _as_decimal(value: Any) -> Decimal:
+    """Convert an amount to Decimal, passing Decimals through unchanged."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
 
 class ValidationRule(ABC):
-    """Abstract base class for validation rules."""
+    """Abstract base class for validation rules.
+
+    Rules that block (I/O, external lookups) should set ``offload`` so the
+    validation agent runs them concurrently in worker threads; they must
+    not mutate shared state. Pure in-memory checks stay inline, where they
+    are cheaper than a thread hop.
+    """
+
+    offload: bool = False
 
     def __init__(
         self,
@@ -49,30 +69,53 @@ class ValidationRule(ABC):
         """Validate the extraction and return any issues found."""
         ...
 
+    def validate_batch(
+        self,
+        extractions: Sequence[BaseExtraction],
+    ) -> list[list[ValidationIssue]]:
+        """Validate several extractions, returning each one's issues in order.
+
+        Subclasses can override this to check a field across the whole
+        batch at once instead of calling ``validate`` per extraction.
+        """
+        return [self.validate(extraction) for extraction in extractions]
+
 
 class ValidationRuleRegistry:
-    """Registry for validation rules."""
+    """Registry for validation rules.
+
+    Applicable rules are resolved once per document type and reused until
+    the next ``register`` or ``clear``.
+    """
 
     _instance: "ValidationRuleRegistry | None" = None
     _rules: list[ValidationRule]
+    _by_type: dict[DocumentType, tuple[ValidationRule, ...]]
 
     def __new__(cls) -> "ValidationRuleRegistry":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._rules = []
+            cls._instance._by_type = {}
         return cls._instance
 
     def register(self, rule: ValidationRule) -> None:
         """Register a validation rule."""
         self._rules.append(rule)
+        self._by_type.clear()
 
     def get_rules(self, document_type: DocumentType) -> list[ValidationRule]:
         """Get all rules that apply to a document type."""
-        return [r for r in self._rules if r.applies_to(document_type)]
+        rules = self._by_type.get(document_type)
+        if rules is None:
+            rules = tuple(r for r in self._rules if r.applies_to(document_type))
+            self._by_type[document_type] = rules
+        return list(rules)
 
     def clear(self) -> None:
         """Clear all registered rules (for testing)."""
         self._rules = []
+        self._by_type.clear()
 
     @property
     def all_rules(self) -> list[ValidationRule]:
@@ -106,20 +149,23 @@ class RequiredFieldRule(ValidationRule):
             document_types=document_types,
         )
         self.field_name = field_name
+        self._getter = attrgetter(field_name)
+        self._missing_issue = partial(
+            ValidationIssue,
+            field=field_name,
+            severity=self.severity,
+            message=f"Required field '{field_name}' is missing or empty",
+            rule=self.name,
+            expected="non-empty value",
+        )
 
     def validate(self, extraction: BaseExtraction) -> list[ValidationIssue]:
-        value = getattr(extraction, self.field_name, None)
+        try:
+            value = self._getter(extraction)
+        except AttributeError:
+            value = None
         if value is None or (isinstance(value, str) and not value.strip()):
-            return [
-                ValidationIssue(
-                    field=self.field_name,
-                    severity=self.severity,
-                    message=f"Required field '{self.field_name}' is missing or empty",
-                    rule=self.name,
-                    expected="non-empty value",
-                    actual=value,
-                )
-            ]
+            return [self._missing_issue(actual=value)]
         return []
 
 
@@ -260,10 +306,12 @@ class DateOrderRule(ValidationRule):
         self.earlier_field = earlier_field
         self.later_field = later_field
 
-    def validate(self, extraction: BaseExtraction) -> list[ValidationIssue]:
-        earlier = getattr(extraction, self.earlier_field, None)
-        later = getattr(extraction, self.later_field, None)
+    def _check(self, earlier: Any, later: Any) -> list[ValidationIssue]:
+        """Compare one pair of values; validate and validate_batch both use this.
 
+        Missing or non-date values pass, as they always have here; flagging
+        a malformed date is DateFormatRule's job.
+        """
         if earlier is None or later is None:
             return []
         if not isinstance(earlier, date) or not isinstance(later, date):
@@ -281,6 +329,21 @@ class DateOrderRule(ValidationRule):
             ]
         return []
 
+    def validate(self, extraction: BaseExtraction) -> list[ValidationIssue]:
+        return self._check(
+            getattr(extraction, self.earlier_field, None),
+            getattr(extraction, self.later_field, None),
+        )
+
+    def validate_batch(
+        self,
+        extractions: Sequence[BaseExtraction],
+    ) -> list[list[ValidationIssue]]:
+        # Pull both date columns up front, then compare them pairwise
+        earlier = [getattr(e, self.earlier_field, None) for e in extractions]
+        later = [getattr(e, self.later_field, None) for e in extractions]
+        return list(map(self._check, earlier, later))
+
 
 class TotalMatchesSubtotalPlusTaxRule(ValidationRule):
     """Validate that total equals subtotal plus tax."""
@@ -301,13 +364,13 @@ class TotalMatchesSubtotalPlusTaxRule(ValidationRule):
         if subtotal is None or total is None:
             return []
 
-        tax_value = tax if tax is not None else Decimal(0)
-
-        expected_total = Decimal(str(subtotal)) + Decimal(str(tax_value))
-        actual_total = Decimal(str(total))
+        expected_total = _as_decimal(subtotal)
+        if tax is not None:
+            expected_total += _as_decimal(tax)
+        actual_total = _as_decimal(total)
 
         # Allow small tolerance for floating point
-        if abs(expected_total - actual_total) > Decimal("0.01"):
+        if abs(expected_total - actual_total) > _AMOUNT_TOLERANCE:
             return [
                 ValidationIssue(
                     field="total_amount",
@@ -339,15 +402,15 @@ class LineItemsTotalRule(ValidationRule):
         if not line_items or subtotal is None:
             return []
 
-        items_total = Decimal(0)
-        for item in line_items:
-            item_total = item.calculate_total()
-            if item_total is not None:
-                items_total += item_total
+        # Accumulate in the builtin sum rather than a per-item Python loop
+        items_total = sum(
+            (t for t in map(LineItem.calculate_total, line_items) if t is not None),
+            Decimal(0),
+        )
 
-        expected_subtotal = Decimal(str(subtotal))
+        expected_subtotal = _as_decimal(subtotal)
 
-        if abs(items_total - expected_subtotal) > Decimal("0.01"):
+        if abs(items_total - expected_subtotal) > _AMOUNT_TOLERANCE:
             return [
                 ValidationIssue(
                     field="line_items",
@@ -29,6 +29,15 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _read_text(file_path: Path) -> str:
+    """Read a document file, exiting with an error if it doesn't exist."""
+    try:
+        return file_path.read_text()
+    except FileNotFoundError:
+        console.print(f"[red]Error: File not found: {file_path}[/red]")
+        raise typer.Exit(1) from None
+
+
 @app.callback()
 def main(
     version: bool = typer.Option(
@@ -56,12 +65,8 @@ def process(
     mock: bool = typer.Option(False, "--mock", help="Use mock LLM for testing"),
 ) -> None:
     """Process a document through the full workflow."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File not found: {file_path}[/red]")
-        raise typer.Exit(1)
-
     # Read document content
-    content = file_path.read_text()
+    content = _read_text(file_path)
 
     # Create document
     document_type = DocumentType(doc_type) if doc_type else None
@@ -79,7 +84,7 @@ def process(
             MockLLMClient,
         )
         all_responses = {**CLASSIFICATION_RESPONSES, **EXTRACTION_RESPONSES}
-        client = MockLLMClient(responses=all_responses)
+        client = MockLLMClient(responses=all_responses, record_history=False)
     else:
         from idp.llm.bedrock import BedrockClient
         client = BedrockClient()
@@ -98,8 +103,11 @@ def process(
 
         # Show classification
         doc_type_result = result.state.context.get("document_type", "unknown")
-        confidence = result.state.context.get("classification_confidence", 0)
-        console.print(f"Document Type: [cyan]{doc_type_result}[/cyan] (confidence: {confidence:.2%})")
+        confidence = result.state.context.get("classification_confidence")
+        confidence_text = "n/a" if confidence is None else f"{confidence:.2%}"
+        console.print(
+            f"Document Type: [cyan]{doc_type_result}[/cyan] (confidence: {confidence_text})"
+        )
 
         # Show extraction summary
         extracted = result.state.context.get("extracted_data", {})
@@ -136,13 +144,12 @@ def process(
 def classify(
     file_path: Path = typer.Argument(..., help="Path to document file"),
     mock: bool = typer.Option(False, "--mock", help="Use mock LLM for testing"),
+    cache_dir: Path | None = typer.Option(
+        None, "--cache-dir", help="Cache classification results in this directory"
+    ),
 ) -> None:
     """Classify a document type."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File not found: {file_path}[/red]")
-        raise typer.Exit(1)
-
-    content = file_path.read_text()
+    content = _read_text(file_path)
     doc = Document(
         id=file_path.stem,
         pages=[DocumentPage(page_number=1, content=content)],
@@ -156,8 +163,10 @@ def classify(
         from idp.llm.bedrock import BedrockClient
         client = BedrockClient()
 
+    from idp.agents import AgentCache
     from idp.agents.classification import ClassificationAgent, ClassificationInput
-    agent = ClassificationAgent(llm_client=client)
+    cache = AgentCache(cache_dir) if cache_dir else None
+    agent = ClassificationAgent(llm_client=client, cache=cache)
 
     # Run classification
     console.print(f"Classifying: [cyan]{file_path}[/cyan]")
@@ -187,11 +196,12 @@ def extract(
     doc_type: str = typer.Option(..., "--type", "-t", help="Document type"),
     output: Path | None = typer.Option(None, "--output", "-o", help="Output JSON file"),
     mock: bool = typer.Option(False, "--mock", help="Use mock LLM for testing"),
+    cache_dir: Path | None = typer.Option(
+        None, "--cache-dir", help="Cache extraction results in this directory"
+    ),
 ) -> None:
     """Extract data from a document."""
-    if not file_path.exists():
-        console.print(f"[red]Error: File not found: {file_path}[/red]")
-        raise typer.Exit(1)
+    content = _read_text(file_path)
 
     try:
         document_type = DocumentType(doc_type)
@@ -200,7 +210,6 @@ def extract(
         console.print(f"Valid types: {[t.value for t in DocumentType]}")
         raise typer.Exit(1)
 
-    content = file_path.read_text()
     doc = Document(
         id=file_path.stem,
         pages=[DocumentPage(page_number=1, content=content)],
@@ -215,8 +224,10 @@ def extract(
         from idp.llm.bedrock import BedrockClient
         client = BedrockClient()
 
+    from idp.agents import AgentCache
     from idp.agents.extraction import ExtractionAgent, ExtractionInput
-    agent = ExtractionAgent(llm_client=client)
+    cache = AgentCache(cache_dir) if cache_dir else None
+    agent = ExtractionAgent(llm_client=client, cache=cache)
 
     # Run extraction
     console.print(f"Extracting from: [cyan]{file_path}[/cyan] (type: {doc_type})")
@@ -283,7 +294,7 @@ def evaluate(
 
     # Create engine with mock client
     all_responses = {**CLASSIFICATION_RESPONSES, **EXTRACTION_RESPONSES}
-    client = MockLLMClient(responses=all_responses)
+    client = MockLLMClient(responses=all_responses, record_history=False)
 
     from idp.orchestration import WorkflowEngine
     engine = WorkflowEngine(llm_client=client)
@@ -51,6 +51,25 @@ class Settings(BaseSettings):
     retry_max_attempts: int = Field(default=3, description="Max retry attempts")
     retry_base_delay: float = Field(default=1.0, description="Base delay between retries (seconds)")
     retry_max_delay: float = Field(default=30.0, description="Max delay between retries (seconds)")
+    feedback_max_retries: int = Field(
+        default=2, ge=0, description="Re-prompts with the parse error before an extraction fails"
+    )
+
+    # Agent output cache
+    agent_cache_dir: str | None = Field(
+        default=None, description="Directory for cached agent outputs (disabled when unset)"
+    )
+
+    # Orchestration
+    batch_concurrency: int = Field(
+        default=8, ge=1, description="Max documents processed concurrently in a batch"
+    )
+    classification_skip_threshold: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Min confidence at which a preset document type skips classification",
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
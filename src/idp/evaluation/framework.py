@@ -131,8 +131,8 @@ class EvaluationFramework:
             latency_ms = (time.perf_counter() - start_time) * 1000
 
             # Check classification
-            actual_type = result.state.context.get("document_type")
-            classification_correct = actual_type == test_case.expected_type.value
+            actual_type = result.state.doc_type or result.state.context.get("document_type")
+            classification_correct = actual_type == test_case.expected_type
 
             # Check extraction
             actual_data = result.state.context.get("extracted_data", {})
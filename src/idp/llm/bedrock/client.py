@@ -11,7 +11,7 @@ from botocore.config import Config
 from idp.core.config import Settings, get_settings
 from idp.core.exceptions import LLMError
 from idp.core.logging import get_logger
-from idp.llm.client import BaseLLMClient, LLMMessage, LLMResponse, MessageRole
+from idp.llm.client import BaseLLMClient, LLMMessage, LLMResponse, MessageRole, parse_json
 
 logger = get_logger(__name__)
 
@@ -228,7 +228,7 @@ Respond ONLY with the JSON object, no additional text or markdown formatting."""
             content = content.strip()
 
         try:
-            json.loads(content)
+            data = parse_json(content)
         except json.JSONDecodeError as e:
             logger.warning(
                 "Invalid JSON response from LLM",
@@ -241,7 +241,7 @@ Respond ONLY with the JSON object, no additional text or markdown formatting."""
                 retryable=True,
             ) from e
 
-        return LLMResponse(
+        result = LLMResponse(
             content=content,
             model=response.model,
             input_tokens=response.input_tokens,
@@ -250,3 +250,6 @@ Respond ONLY with the JSON object, no additional text or markdown formatting."""
             stop_reason=response.stop_reason,
             raw_response=response.raw_response,
         )
+        # Already parsed for validation, so callers reading .data don't parse again
+        result.data = data
+        return result
@@ -1,10 +1,26 @@
 """Base LLM client interface."""
 
+import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cached_property
 from typing import Any
 
+import pydantic_core
+
+
+def parse_json(content: str) -> Any:
+    """Parse JSON text with pydantic-core's parser.
+
+    Raises:
+        json.JSONDecodeError: If the content isn't valid JSON, matching ``json.loads``
+    """
+    try:
+        return pydantic_core.from_json(content)
+    except ValueError as e:
+        raise json.JSONDecodeError(str(e), content, 0) from e
+
 
 class MessageRole(StrEnum):
     """Message role in a conversation."""
@@ -14,7 +30,7 @@ class MessageRole(StrEnum):
     ASSISTANT = "assistant"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMMessage:
     """A message in the LLM conversation."""
 
@@ -43,6 +59,15 @@ class LLMResponse:
         """Get total token count."""
         return self.input_tokens + self.output_tokens
 
+    @cached_property
+    def data(self) -> Any:
+        """Get the content parsed as JSON, parsing it at most once.
+
+        Raises:
+            json.JSONDecodeError: If the content isn't valid JSON
+        """
+        return parse_json(self.content)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -3,7 +3,7 @@
 import json
 import re
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from idp.llm.client import BaseLLMClient, LLMMessage, LLMResponse
@@ -11,12 +11,21 @@ from idp.llm.client import BaseLLMClient, LLMMessage, LLMResponse
 
 @dataclass
 class MockResponse:
-    """A mock response configuration."""
+    """A mock response configuration.
+
+    Dict content is serialized once at construction, so it shouldn't be
+    modified afterwards.
+    """
 
     content: str | dict[str, Any]
     input_tokens: int = 100
     output_tokens: int = 50
     latency_ms: float = 100.0
+    _text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Serialize the content once instead of on every call."""
+        self._text = self.content if isinstance(self.content, str) else json.dumps(self.content)
 
 
 ResponseGenerator = Callable[[list[LLMMessage]], MockResponse]
@@ -30,6 +39,7 @@ class MockLLMClient(BaseLLMClient):
         default_response: str | MockResponse | None = None,
         responses: dict[str, MockResponse] | None = None,
         response_generator: ResponseGenerator | None = None,
+        record_history: bool = True,
     ) -> None:
         """Initialize mock client.
 
@@ -37,13 +47,19 @@ class MockLLMClient(BaseLLMClient):
             default_response: Default response for any message
             responses: Map of regex patterns to responses
             response_generator: Function to generate responses dynamically
+            record_history: Whether to record calls in ``call_history``
         """
         self._default_response = default_response or MockResponse(
             content="Mock response"
         )
-        self._responses = responses or {}
+        # Patterns are compiled once here rather than on every lookup
+        self._responses: dict[str, tuple[re.Pattern[str], MockResponse]] = {
+            pattern: (re.compile(pattern, re.IGNORECASE), response)
+            for pattern, response in (responses or {}).items()
+        }
         self._response_generator = response_generator
         self._call_history: list[dict[str, Any]] = []
+        self._record_history = record_history
 
     @property
     def model_id(self) -> str:
@@ -57,7 +73,7 @@ class MockLLMClient(BaseLLMClient):
 
     def add_response(self, pattern: str, response: MockResponse) -> None:
         """Add a response for a specific message pattern."""
-        self._responses[pattern] = response
+        self._responses[pattern] = (re.compile(pattern, re.IGNORECASE), response)
 
     def clear_history(self) -> None:
         """Clear call history."""
@@ -71,8 +87,8 @@ class MockLLMClient(BaseLLMClient):
 
         # Check pattern-based responses
         last_message = messages[-1].content if messages else ""
-        for pattern, response in self._responses.items():
-            if re.search(pattern, last_message, re.IGNORECASE):
+        for regex, response in self._responses.values():
+            if regex.search(last_message):
                 return response
 
         # Return default
@@ -90,19 +106,17 @@ class MockLLMClient(BaseLLMClient):
         stop_sequences: list[str] | None = None,
     ) -> LLMResponse:
         """Generate a mock response."""
-        # Record the call
-        self._call_history.append({
-            "messages": [m.to_dict() for m in messages],
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "system": system,
-            "stop_sequences": stop_sequences,
-        })
+        if self._record_history:
+            self._call_history.append({
+                "messages": [m.to_dict() for m in messages],
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "system": system,
+                "stop_sequences": stop_sequences,
+            })
 
         mock_resp = self._find_response(messages)
-        content = mock_resp.content
-        if isinstance(content, dict):
-            content = json.dumps(content)
+        content = mock_resp._text
 
         return LLMResponse(
             content=content,
@@ -123,23 +137,20 @@ class MockLLMClient(BaseLLMClient):
         system: str | None = None,
     ) -> LLMResponse:
         """Generate a mock JSON response."""
-        # Record the call
-        self._call_history.append({
-            "messages": [m.to_dict() for m in messages],
-            "schema": schema,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "system": system,
-        })
+        if self._record_history:
+            self._call_history.append({
+                "messages": [m.to_dict() for m in messages],
+                "schema": schema,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "system": system,
+            })
 
         mock_resp = self._find_response(messages)
-        content = mock_resp.content
+        content = mock_resp._text
 
-        # Ensure it's JSON
-        if isinstance(content, dict):
-            content = json.dumps(content)
-        elif not content.strip().startswith("{"):
-            # Wrap in JSON if not already
+        # Wrap plain-text content in JSON
+        if isinstance(mock_resp.content, str) and not content.strip().startswith("{"):
             content = json.dumps({"result": content})
 
         return LLMResponse(
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentType(StrEnum):
@@ -27,7 +27,12 @@ class DocumentStatus(StrEnum):
 
 
 class DocumentPage(BaseModel):
-    """Represents a single page of a document."""
+    """Represents a single page of a document.
+
+    Pages are immutable so that documents can cache text derived from them.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     page_number: int = Field(..., ge=1, description="Page number (1-indexed)")
     content: str = Field(..., description="Text content of the page")
@@ -57,7 +62,7 @@ class Document(BaseModel):
     """Represents a document to be processed."""
 
     id: str = Field(..., description="Unique document identifier")
-    pages: list[DocumentPage] = Field(default_factory=list, description="Document pages")
+    pages: tuple[DocumentPage, ...] = Field(default=(), description="Document pages")
     metadata: DocumentMetadata = Field(default_factory=DocumentMetadata)
     status: DocumentStatus = Field(default=DocumentStatus.PENDING)
     document_type: DocumentType | None = Field(
@@ -74,10 +79,26 @@ class Document(BaseModel):
     )
     error: str | None = Field(default=None, description="Error message if processing failed")
 
+    def _page_views(self) -> tuple[str, dict[int, DocumentPage]]:
+        """Get the joined page text and page-number index.
+
+        Both are built once per ``pages`` tuple and rebuilt when it's replaced.
+        Like a ``cached_property`` they live in ``__dict__``, so equality and
+        serialization ignore them.
+        """
+        pages, full_text, index = self.__dict__.get("_page_cache", (None, "", {}))
+        if pages is not self.pages:
+            full_text = "\n\n".join(page.content for page in self.pages)
+            index = {}
+            for page in self.pages:
+                index.setdefault(page.page_number, page)
+            self.__dict__["_page_cache"] = (self.pages, full_text, index)
+        return full_text, index
+
     @property
     def full_text(self) -> str:
         """Get concatenated text from all pages."""
-        return "\n\n".join(page.content for page in self.pages)
+        return self._page_views()[0]
 
     @property
     def page_count(self) -> int:
@@ -86,7 +107,4 @@ class Document(BaseModel):
 
     def get_page(self, page_number: int) -> DocumentPage | None:
         """Get a specific page by number (1-indexed)."""
-        for page in self.pages:
-            if page.page_number == page_number:
-                return page
-        return None
+        return self._page_views()[1].get(page_number)
@@ -4,22 +4,32 @@ from datetime import date
 from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 
 class Address(BaseModel):
     """Structured address."""
 
+    model_config = ConfigDict(validate_assignment=True)
+
     street: str | None = None
     city: str | None = None
     state: str | None = None
     postal_code: str | None = None
     country: str | None = None
 
+    _is_complete: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="after")
+    def _compute_is_complete(self) -> "Address":
+        """Materialize the completeness flag once after field validation."""
+        self._is_complete = bool(self.city and (self.state or self.country))
+        return self
+
     @property
     def is_complete(self) -> bool:
         """Check if address has minimum required fields."""
-        return bool(self.city and (self.state or self.country))
+        return self._is_complete
 
 
 class Party(BaseModel):
@@ -78,9 +88,8 @@ class InvoiceExtraction(BaseExtraction):
 
     def calculate_subtotal(self) -> Decimal:
         """Calculate subtotal from line items."""
-        return sum(
-            (item.calculate_total() or Decimal(0)) for item in self.line_items
-        )
+        totals = map(LineItem.calculate_total, self.line_items)
+        return sum((total for total in totals if total is not None), Decimal(0))
 
 
 class ReceiptExtraction(BaseExtraction):
@@ -1,11 +1,14 @@
 """Workflow-related data models."""
 
+from collections.abc import Sequence
 from datetime import datetime
 from enum import StrEnum
-from typing import Any
+from typing import Any, TypedDict
 
 from pydantic import BaseModel, Field
 
+from idp.models.document import DocumentType
+
 
 class StepStatus(StrEnum):
     """Status of a workflow step."""
@@ -17,6 +20,13 @@ class StepStatus(StrEnum):
     SKIPPED = "skipped"
 
 
+class StepColumns(TypedDict):
+    """Step data of a workflow state as parallel columns."""
+
+    names: list[str]
+    statuses: list[StepStatus]
+
+
 class WorkflowStep(BaseModel):
     """Represents a single step in a workflow."""
 
@@ -48,7 +58,13 @@ class WorkflowState(BaseModel):
     steps: list[WorkflowStep] = Field(default_factory=list)
     started_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: datetime | None = None
+    duration_ns: int | None = Field(
+        default=None, description="Monotonic workflow duration in nanoseconds"
+    )
     status: StepStatus = Field(default=StepStatus.PENDING)
+    doc_type: DocumentType | None = Field(
+        default=None, description="Document type, set once classification completes"
+    )
     context: dict[str, Any] = Field(
         default_factory=dict, description="Shared context across steps"
     )
@@ -66,9 +82,22 @@ class WorkflowState(BaseModel):
         self.steps.append(step)
         return step
 
+    def to_soa(self) -> StepColumns:
+        """Get step data as parallel columns (structure of arrays) for metrics.
+
+        Returns:
+            Columns ``names`` and ``statuses``, indexed by step
+        """
+        return {
+            "names": [step.name for step in self.steps],
+            "statuses": [step.status for step in self.steps],
+        }
+
     @property
     def duration_ms(self) -> float | None:
         """Calculate total workflow duration in milliseconds."""
+        if self.duration_ns is not None:
+            return self.duration_ns / 1_000_000
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds() * 1000
         return None
@@ -89,6 +118,10 @@ class WorkflowResult(BaseModel):
     @classmethod
     def from_state(cls, state: WorkflowState, error: str | None = None) -> "WorkflowResult":
         """Create a result from workflow state."""
+        completed = 0
+        for step in state.steps:
+            if step.status == StepStatus.COMPLETED:
+                completed += 1
         return cls(
             workflow_id=state.workflow_id,
             document_id=state.document_id,
@@ -98,8 +131,42 @@ class WorkflowResult(BaseModel):
             metrics={
                 "total_duration_ms": state.duration_ms,
                 "step_count": len(state.steps),
-                "completed_steps": sum(
-                    1 for s in state.steps if s.status == StepStatus.COMPLETED
-                ),
+                "completed_steps": completed,
             },
         )
+
+    @staticmethod
+    def aggregate_metrics(results: Sequence["WorkflowResult"]) -> dict[str, Any]:
+        """Aggregate metrics across a batch of results in a single pass.
+
+        Args:
+            results: Results to aggregate
+
+        Returns:
+            Batch-level counts, failure rate and mean duration
+        """
+        failed = 0
+        step_count = 0
+        failed_steps = 0
+        timed = 0
+        total_duration_ns = 0
+        for result in results:
+            if not result.success:
+                failed += 1
+            step_count += len(result.state.steps)
+            for step in result.state.steps:
+                if step.status == StepStatus.FAILED:
+                    failed_steps += 1
+            if result.state.duration_ns is not None:
+                timed += 1
+                total_duration_ns += result.state.duration_ns
+
+        total = len(results)
+        return {
+            "document_count": total,
+            "failed_count": failed,
+            "failure_rate": failed / total if total else 0.0,
+            "step_count": step_count,
+            "failed_steps": failed_steps,
+            "mean_duration_ms": total_duration_ns / timed / 1_000_000 if timed else None,
+        }
@@ -2,6 +2,7 @@
 
 from idp.orchestration.engine import WorkflowEngine
 from idp.orchestration.workflows import (
+    ContextFlag,
     StandardDocumentWorkflow,
     StepDefinition,
     WorkflowDefinition,
@@ -11,5 +12,6 @@ __all__ = [
     "WorkflowEngine",
     "WorkflowDefinition",
     "StepDefinition",
+    "ContextFlag",
     "StandardDocumentWorkflow",
 ]
@@ -1,19 +1,33 @@
 """Workflow engine for orchestrating document processing."""
 
+import asyncio
+import time
 import uuid
-from datetime import datetime
+from collections.abc import AsyncIterator, Callable, Iterable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from idp.core.config import Settings, get_settings
+from idp.core.exceptions import WorkflowError
 from idp.core.logging import get_logger
 from idp.llm.client import BaseLLMClient
-from idp.models.document import Document
+from idp.models.document import Document, DocumentType
 from idp.models.workflow import StepStatus, WorkflowResult, WorkflowState, WorkflowStep
 from idp.orchestration.graph import DocumentProcessingGraph
-from idp.orchestration.workflows import WorkflowDefinition
+from idp.orchestration.workflows import StandardDocumentWorkflow, WorkflowDefinition
 
 logger = get_logger(__name__)
 
+_DOC_TYPE_LOOKUP: dict[str, DocumentType] = {dt.value: dt for dt in DocumentType}
+
+# (step name, graph state key, output shaper) for steps inferred from a
+# non-empty graph state value
+_INFERRED_STEPS: tuple[tuple[str, str, Callable[[Any], dict[str, Any]]], ...] = (
+    ("classification", "document_type", lambda v: {"document_type": v}),
+    ("retrieval", "retrieved_context", lambda v: {"count": len(v)}),
+    ("extraction", "extracted_data", lambda v: v),
+)
+
 
 class WorkflowEngine:
     """Engine for executing document processing workflows using LangGraph."""
@@ -29,11 +43,30 @@ class WorkflowEngine:
         Args:
             llm_client: LLM client for agents (kept for interface compatibility)
             settings: Application settings
-            workflow: Workflow definition to use (ignored in LangGraph version for now)
+            workflow: Workflow definition to use; its step handlers must name graph nodes
+
+        Raises:
+            WorkflowError: If a workflow step references an unknown handler or dependency
         """
         self._settings = settings or get_settings()
         self._graph = DocumentProcessingGraph()
-        
+        self._workflow = workflow or StandardDocumentWorkflow
+
+        # Resolve step handlers and dependencies once so bad names fail at construction
+        for step_def in self._workflow.steps:
+            if step_def.handler not in self._graph.handlers:
+                raise WorkflowError(
+                    f"Unknown handler '{step_def.handler}' for step '{step_def.name}'",
+                    step_name=step_def.name,
+                    details={"available": sorted(self._graph.handlers)},
+                )
+            for dep in step_def.depends_on:
+                if self._workflow.get_step(dep) is None:
+                    raise WorkflowError(
+                        f"Step '{step_def.name}' depends on unknown step '{dep}'",
+                        step_name=step_def.name,
+                    )
+
         logger.info("Initialized LangGraph workflow engine")
 
     async def process(self, document: Document) -> WorkflowResult:
@@ -45,8 +78,9 @@ class WorkflowEngine:
         Returns:
             Workflow result with state and any errors
         """
-        workflow_id = str(uuid.uuid4())
-        start_time = datetime.utcnow()
+        workflow_id = uuid.uuid4().hex
+        start_time = datetime.now(UTC)
+        start_ns = time.perf_counter_ns()
         
         logger.info(
             "Starting workflow",
@@ -93,61 +127,159 @@ class WorkflowEngine:
         # Note: We are approximating step execution details as LangGraph invoke 
         # doesn't give granular step timings by default without streaming/tracing.
         
+        # Durations come from the monotonic clock; the wall clock is read once
+        duration_ns = time.perf_counter_ns() - start_ns
+        # Shared by the context and the validation step rather than re-read
+        validation_issues = final_state.get("validation_issues")
+        document_type = final_state.get("document_type")
         workflow_state = WorkflowState(
             workflow_id=workflow_id,
             document_id=document.id,
             status=final_status,
             started_at=start_time,
-            completed_at=datetime.utcnow(),
+            completed_at=start_time + timedelta(microseconds=duration_ns / 1000),
+            duration_ns=duration_ns,
+            doc_type=_DOC_TYPE_LOOKUP.get(document_type) if document_type else None,
             context={
-                "document_type": final_state.get("document_type"),
+                "document_type": document_type,
                 "classification_confidence": final_state.get("classification_confidence"),
                 "extraction": final_state.get("extracted_data"),
-                "validation_issues": final_state.get("validation_issues"),
+                "validation_issues": validation_issues,
                 "retrieved_context": final_state.get("retrieved_context"),
             }
         )
         
-        # Add performed steps to state (inferred)
-        if final_state.get("document_type"):
-            step = workflow_state.add_step("classification")
-            step.status = StepStatus.COMPLETED
-            step.output_data = {"document_type": final_state["document_type"]}
-
-        if final_state.get("retrieved_context"):
-            step = workflow_state.add_step("retrieval")
-            step.status = StepStatus.COMPLETED
-            step.output_data = {"count": len(final_state["retrieved_context"])}
-            
-        if final_state.get("extracted_data"):
-            step = workflow_state.add_step("extraction")
-            step.status = StepStatus.COMPLETED
-            step.output_data = final_state["extracted_data"]
+        # Add performed steps to state (inferred), one graph key read per step
+        for name, key, shape in _INFERRED_STEPS:
+            value = final_state.get(key)
+            if value:
+                step = workflow_state.add_step(name)
+                step.status = StepStatus.COMPLETED
+                step.output_data = shape(value)
 
+        # Validation is recorded whenever it set a verdict, including False
         if final_state.get("is_valid") is not None:
              step = workflow_state.add_step("validation")
              step.status = StepStatus.COMPLETED
              step.output_data = {
                  "valid": final_state["is_valid"], 
-                 "issues": final_state.get("validation_issues")
+                 "issues": validation_issues,
              }
 
         return WorkflowResult.from_state(workflow_state, error_message)
 
+    async def _process_isolated(self, document: Document) -> WorkflowResult:
+        """Process a document, reporting any exception as a failed result."""
+        try:
+            return await self.process(document)
+        except Exception as e:
+            logger.error(
+                "Batch document failed",
+                document_id=document.id,
+                error=str(e),
+            )
+            # Aware like the start time, so duration_ms can subtract them
+            now = datetime.now(UTC)
+            state = WorkflowState(
+                workflow_id=uuid.uuid4().hex,
+                document_id=document.id,
+                status=StepStatus.FAILED,
+                started_at=now,
+                completed_at=now,
+            )
+            return WorkflowResult.from_state(state, str(e))
+
+    async def _run_pipeline(
+        self,
+        documents: Iterable[Document],
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, WorkflowResult]]:
+        """Feed documents through a bounded worker pool.
+
+        A feeder task pushes documents onto a bounded queue, a pool of
+        ``max_concurrency`` workers (``settings.batch_concurrency`` by default)
+        processes them, and results are yielded with their input index as soon
+        as each one finishes.
+        """
+        concurrency = max(1, max_concurrency or self._settings.batch_concurrency)
+        pending: asyncio.Queue[tuple[int, Document] | None] = asyncio.Queue(maxsize=concurrency)
+        finished: asyncio.Queue[tuple[int, WorkflowResult] | None] = asyncio.Queue(
+            maxsize=concurrency
+        )
+
+        async def feed() -> None:
+            try:
+                for item in enumerate(documents):
+                    await pending.put(item)
+            finally:
+                for _ in range(concurrency):
+                    await pending.put(None)
+
+        async def work() -> None:
+            try:
+                while (item := await pending.get()) is not None:
+                    index, document = item
+                    await finished.put((index, await self._process_isolated(document)))
+            finally:
+                await finished.put(None)
+
+        feeder = asyncio.create_task(feed())
+        workers = [asyncio.create_task(work()) for _ in range(concurrency)]
+        try:
+            active = concurrency
+            while active:
+                item = await finished.get()
+                if item is None:
+                    active -= 1
+                else:
+                    yield item
+            # Surface errors raised while iterating the input
+            await feeder
+        finally:
+            for task in (feeder, *workers):
+                task.cancel()
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
+
+    async def process_stream(
+        self,
+        documents: Iterable[Document],
+    ) -> AsyncIterator[WorkflowResult]:
+        """Process documents concurrently, yielding results as they complete.
+
+        Unlike ``process_batch`` this doesn't hold every document's result
+        until the end, so it suits long or lazily produced inputs.
+
+        Args:
+            documents: Documents to process
+
+        Yields:
+            Workflow results in completion order
+        """
+        async for _, result in self._run_pipeline(documents):
+            yield result
+
     async def process_batch(
         self,
         documents: list[Document],
+        max_concurrency: int | None = None,
     ) -> list[WorkflowResult]:
-        """Process multiple documents.
+        """Process multiple documents concurrently.
+
+        At most ``max_concurrency`` documents are in flight at once.
+        A document that raises is reported as a failed result rather than
+        aborting the rest of the batch.
 
         Args:
             documents: Documents to process
+            max_concurrency: Concurrency limit, defaults to ``settings.batch_concurrency``
 
         Returns:
-            List of workflow results
+            List of workflow results, in the same order as ``documents``
         """
-        results = []
-        for doc in documents:
-            result = await self.process(doc)
-            results.append(result)
+        slots: list[WorkflowResult | None] = [None] * len(documents)
+        async for index, result in self._run_pipeline(documents, max_concurrency):
+            slots[index] = result
+        results = [result for result in slots if result is not None]
+
+        logger.info("Batch completed", **WorkflowResult.aggregate_metrics(results))
         return results
@@ -1,6 +1,7 @@
 """LangGraph workflow definition for document processing."""
 
-from typing import Any, Annotated, TypedDict
+from collections.abc import Awaitable
+from typing import Any, Annotated, Protocol, TypedDict
 import operator
 
 from langgraph.graph import StateGraph, END
@@ -8,7 +9,7 @@ from langgraph.graph import StateGraph, END
 from idp.core.config import get_settings
 from idp.core.logging import get_logger
 from idp.models.document import Document, DocumentType
-from idp.services.bedrock import BedrockService
+from idp.services.bedrock import get_bedrock_service
 
 logger = get_logger(__name__)
 
@@ -26,13 +27,27 @@ class GraphState(TypedDict):
     error: str | None
 
 
+class NodeHandler(Protocol):
+    """Async graph node; ``state`` is named to match LangGraph's node protocol."""
+
+    def __call__(self, state: GraphState) -> Awaitable[dict[str, Any]]: ...
+
+
 class DocumentProcessingGraph:
     """Defines the LangGraph workflow."""
 
     def __init__(self):
         """Initialize the graph."""
         self.settings = get_settings()
-        self.bedrock_service = BedrockService()
+        self.bedrock_service = get_bedrock_service()
+        # Node handlers keyed by name, matching StepDefinition.handler
+        self.handlers: dict[str, NodeHandler] = {
+            "classification": self._classification_node,
+            "retrieval": self._retrieval_node,
+            "extraction": self._extraction_node,
+            "validation": self._validation_node,
+        }
+        # Compiled per instance: the nodes are this instance's bound methods
         self.workflow = self._build_graph()
 
     def _build_graph(self) -> StateGraph:
@@ -40,27 +55,21 @@ class DocumentProcessingGraph:
         workflow = StateGraph(GraphState)
 
         # Add nodes
-        workflow.add_node("classification", self._classification_node)
-        workflow.add_node("retrieval", self._retrieval_node)
-        workflow.add_node("extraction", self._extraction_node)
-        workflow.add_node("validation", self._validation_node)
+        for name, handler in self.handlers.items():
+            workflow.add_node(name, handler)
 
         # Define edges
         workflow.set_entry_point("classification")
 
-        # Conditional edge after classification
+        # Conditional edge after classification. Retrieval and extraction
+        # are independent, so fan out to both and join before validation.
         workflow.add_conditional_edges(
             "classification",
-            self._check_classification,
-            {
-                "continue": "retrieval",
-                "unknown": END,
-                "error": END
-            }
+            self._route_after_classification,
+            ["retrieval", "extraction", END],
         )
 
-        workflow.add_edge("retrieval", "extraction")
-        workflow.add_edge("extraction", "validation")
+        workflow.add_edge(["retrieval", "extraction"], "validation")
         workflow.add_edge("validation", END)
 
         return workflow.compile()
@@ -68,10 +77,22 @@ class DocumentProcessingGraph:
     async def _classification_node(self, state: GraphState) -> dict:
         """Classification node."""
         logger.info("Running classification node")
+        doc = state["document"]
+        confidence = doc.classification_confidence
+        if (
+            doc.document_type is not None
+            and confidence is not None
+            and confidence >= self.settings.classification_skip_threshold
+        ):
+            logger.info("Skipping classification for preset document type", document_id=doc.id)
+            return {
+                "document_type": doc.document_type.value,
+                "classification_confidence": doc.classification_confidence,
+            }
+
         try:
             # TODO: Integrate with actual ClassificationAgent or Bedrock Agent
             # For now, simplistic logic or mock
-            doc = state["document"]
             # Placeholder: Use Bedrock to classify if Agent is configured
             if self.settings.bedrock_agent_id:
                  # Call agent...
@@ -99,6 +120,12 @@ class DocumentProcessingGraph:
         
         return "continue"
 
+    def _route_after_classification(self, state: GraphState) -> list[str] | str:
+        """Fan out to retrieval and extraction, or stop after classification."""
+        if self._check_classification(state) == "continue":
+            return ["retrieval", "extraction"]
+        return END
+
     async def _retrieval_node(self, state: GraphState) -> dict:
         """Retrieval node using Bedrock Knowledge Base."""
         logger.info("Running retrieval node")
@@ -7,6 +7,23 @@ from typing import Any
 from idp.models.workflow import WorkflowState
 
 
+@dataclass(slots=True, frozen=True)
+class ContextFlag:
+    """Step condition that reads a flag from the workflow context.
+
+    Equivalent to ``lambda s: bool(s.context.get(key, default))`` but
+    declarative, so it has a readable repr and can be compared and pickled.
+    """
+
+    key: str
+    default: bool = False
+
+    def __call__(self, state: WorkflowState) -> bool:
+        """Check the flag on the given state."""
+        context = state.context
+        return bool(context[self.key]) if self.key in context else self.default
+
+
 @dataclass
 class StepDefinition:
     """Definition of a workflow step."""
@@ -16,7 +33,7 @@ class StepDefinition:
     handler: str  # Fully qualified name of handler function/method
     required: bool = True
     depends_on: list[str] = field(default_factory=list)
-    condition: Callable[[WorkflowState], bool] | None = None
+    condition: Callable[[WorkflowState], bool] | ContextFlag | None = None
     on_error: str = "fail"  # "fail", "skip", "continue"
     timeout_ms: int | None = None
 
@@ -29,30 +46,39 @@ class StepDefinition:
 
 @dataclass
 class WorkflowDefinition:
-    """Definition of a complete workflow."""
+    """Definition of a complete workflow.
+
+    Steps are indexed by name at construction, so they shouldn't be
+    modified afterwards; build a new definition instead.
+    """
 
     name: str
     description: str
     steps: list[StepDefinition]
     version: str = "1.0.0"
     metadata: dict[str, Any] = field(default_factory=dict)
+    _steps_by_name: dict[str, StepDefinition] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index steps by name, keeping the first of any duplicates."""
+        self._steps_by_name = {}
+        for step in self.steps:
+            self._steps_by_name.setdefault(step.name, step)
 
     def get_step(self, name: str) -> StepDefinition | None:
         """Get a step by name."""
-        for step in self.steps:
-            if step.name == name:
-                return step
-        return None
+        return self._steps_by_name.get(name)
 
 
 def _classification_needed(state: WorkflowState) -> bool:
     """Check if classification is needed."""
-    return state.context.get("document_type") is None
+    # The context entry is only consulted for states built without doc_type
+    return state.doc_type is None and state.context.get("document_type") is None
 
 
 def _extraction_possible(state: WorkflowState) -> bool:
     """Check if extraction is possible."""
-    doc_type = state.context.get("document_type")
+    doc_type = state.doc_type or state.context.get("document_type")
     return doc_type is not None and doc_type != "unknown"
 
 
@@ -1,5 +1,9 @@
 """AWS Bedrock service wrapper for Agent Runtime and Knowledge Base interactions."""
 
+import asyncio
+import codecs
+from functools import lru_cache
+
 import boto3
 from botocore.config import Config
 from typing import Any, AsyncGenerator
@@ -21,7 +25,9 @@ class BedrockService:
             region_name=settings.aws_region,
             read_timeout=900,
             connect_timeout=900,
-            retries={"max_attempts": 3}
+            retries={"max_attempts": 3},
+            # Enough pooled connections for a full concurrent batch
+            max_pool_connections=max(10, settings.batch_concurrency),
         )
 
         session_kwargs = {}
@@ -62,7 +68,9 @@ class BedrockService:
             return []
 
         try:
-            response = self._agent_runtime.retrieve(
+            # Run synchronous boto3 call in thread pool
+            response = await asyncio.to_thread(
+                self._agent_runtime.retrieve,
                 knowledgeBaseId=target_kb_id,
                 retrievalQuery={"text": query},
                 retrievalConfiguration={
@@ -104,7 +112,8 @@ class BedrockService:
             raise ValueError("Agent ID and Alias ID must be provided")
 
         try:
-            response = self._agent_runtime.invoke_agent(
+            response = await asyncio.to_thread(
+                self._agent_runtime.invoke_agent,
                 agentId=target_agent_id,
                 agentAliasId=target_alias_id,
                 sessionId=session_id,
@@ -112,14 +121,32 @@ class BedrockService:
                 enableTrace=enable_trace,
             )
 
-            # Stream the response
-            event_stream = response.get("completion")
-            for event in event_stream:
+            # Stream the response, reading each event off the event loop.
+            # Chunks can split a multi-byte character, so decode incrementally
+            # to keep every yielded piece valid for an incremental parser.
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            event_stream = iter(response.get("completion") or [])
+            while True:
+                event = await asyncio.to_thread(next, event_stream, None)
+                if event is None:
+                    break
                 if "chunk" in event:
-                    yield event["chunk"]["bytes"].decode("utf-8")
+                    text = decoder.decode(event["chunk"]["bytes"])
+                    if text:
+                        yield text
                 elif "trace" in event and enable_trace:
                      logger.debug("Agent Trace", trace=event["trace"])
 
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+
         except Exception as e:
             logger.error("Failed to invoke Bedrock Agent", error=str(e))
             raise
+
+
+@lru_cache
+def get_bedrock_service() -> BedrockService:
+    """Get a shared Bedrock service so its client and connection pool are reused."""
+    return BedrockService()
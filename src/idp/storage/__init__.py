@@ -1,11 +1,15 @@
 """Document storage backends."""
 
-from idp.storage.base import StorageBackend
+from idp.storage.base import StorageBackend, get_storage, register_backend
+from idp.storage.caching import CachingStorage
 from idp.storage.local import LocalStorage
 from idp.storage.memory import MemoryStorage
 
 __all__ = [
     "StorageBackend",
+    "get_storage",
+    "register_backend",
+    "CachingStorage",
     "LocalStorage",
     "MemoryStorage",
 ]
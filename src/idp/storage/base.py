@@ -1,13 +1,25 @@
 """Base storage backend interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import TypeVar
 
+from idp.core.config import Settings, get_settings
+from idp.core.exceptions import StorageError
 from idp.models.document import Document
 
+B = TypeVar("B", bound="type[StorageBackend]")
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
 
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "StorageBackend":  # noqa: ARG003
+        """Create a backend configured from settings."""
+        return cls()
+
     @abstractmethod
     async def save(self, document: Document) -> str:
         """Save a document and return its storage key.
@@ -20,6 +32,20 @@ class StorageBackend(ABC):
         """
         ...
 
+    async def save_many(self, documents: list[Document]) -> list[str]:
+        """Save several documents and return their storage keys.
+
+        Backends that can batch writes should override this; the default
+        saves documents one at a time.
+
+        Args:
+            documents: Documents to save
+
+        Returns:
+            Storage keys, in the same order as the documents
+        """
+        return [await self.save(document) for document in documents]
+
     @abstractmethod
     async def load(self, key: str) -> Document | None:
         """Load a document by its storage key.
@@ -32,6 +58,28 @@ class StorageBackend(ABC):
         """
         ...
 
+    async def load_many(
+        self,
+        keys: list[str],
+        max_concurrency: int = 32,
+    ) -> list[Document | None]:
+        """Load several documents concurrently.
+
+        Args:
+            keys: Storage keys
+            max_concurrency: Maximum number of loads in flight at once
+
+        Returns:
+            Documents (None where not found), in the same order as the keys
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load_one(key: str) -> Document | None:
+            async with semaphore:
+                return await self.load(key)
+
+        return list(await asyncio.gather(*(load_one(key) for key in keys)))
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete a document by its storage key.
@@ -67,3 +115,33 @@ class StorageBackend(ABC):
             List of storage keys
         """
         ...
+
+
+# Backend classes keyed by their Settings.storage_backend name
+BACKENDS: dict[str, type[StorageBackend]] = {}
+
+
+def register_backend(name: str) -> Callable[[B], B]:
+    """Register a storage backend class under a name."""
+
+    def decorator(backend_cls: B) -> B:
+        BACKENDS[name] = backend_cls
+        return backend_cls
+
+    return decorator
+
+
+def get_storage(settings: Settings | None = None) -> StorageBackend:
+    """Create the storage backend selected by settings.storage_backend.
+
+    Raises:
+        StorageError: If no backend is registered under that name
+    """
+    settings = settings or get_settings()
+    backend_cls = BACKENDS.get(settings.storage_backend)
+    if backend_cls is None:
+        raise StorageError(
+            f"Unknown storage backend '{settings.storage_backend}'",
+            details={"available": sorted(BACKENDS)},
+        )
+    return backend_cls.from_settings(settings)
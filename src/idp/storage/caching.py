@@ -0,0 +1,100 @@
+"""Read-through caching wrapper for storage backends."""
+
+from collections import OrderedDict
+from itertools import count
+
+from idp.models.document import Document
+from idp.storage.base import StorageBackend
+
+
+class CachingStorage(StorageBackend):
+    """Storage backend that keeps recently loaded documents in an LRU cache.
+
+    Wraps another backend: loads are served from the cache when possible,
+    and saves and deletes invalidate the affected entry. Hits return a deep
+    copy, which costs about as much as validating the JSON again, so the
+    saving is the backend read rather than the parsing.
+    """
+
+    def __init__(self, backend: StorageBackend, max_entries: int = 128) -> None:
+        """Initialize the caching wrapper.
+
+        Args:
+            backend: Backend to read through to
+            max_entries: Maximum number of documents to keep cached
+        """
+        self._backend = backend
+        self._max_entries = max_entries
+        self._cache: OrderedDict[str, Document] = OrderedDict()
+        # Ticket of the latest backend load per key; writes clear it so a
+        # load that overlapped a write doesn't cache what it read
+        self._loading: dict[str, int] = {}
+        self._tickets = count()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of loads served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _invalidate(self, key: str) -> None:
+        """Drop a key from the cache and void any load in flight for it."""
+        self._cache.pop(key, None)
+        self._loading.pop(key, None)
+
+    async def save(self, document: Document) -> str:
+        """Save a document through the wrapped backend."""
+        key = await self._backend.save(document)
+        self._invalidate(key)
+        return key
+
+    async def save_many(self, documents: list[Document]) -> list[str]:
+        """Save documents through the wrapped backend."""
+        keys = await self._backend.save_many(documents)
+        for key in keys:
+            self._invalidate(key)
+        return keys
+
+    async def load(self, key: str) -> Document | None:
+        """Load a document, serving it from the cache when possible."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            # Copy so callers can't mutate the cached instance
+            return cached.model_copy(deep=True)
+        self.misses += 1
+
+        ticket = self._loading[key] = next(self._tickets)
+        try:
+            document = await self._backend.load(key)
+        finally:
+            current = self._loading.get(key) == ticket
+            if current:
+                del self._loading[key]
+        if document is None or not current or self._max_entries <= 0:
+            return document
+
+        self._cache[key] = document.model_copy(deep=True)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return document
+
+    async def delete(self, key: str) -> bool:
+        """Delete a document through the wrapped backend."""
+        deleted = await self._backend.delete(key)
+        self._invalidate(key)
+        return deleted
+
+    async def exists(self, key: str) -> bool:
+        """Check if a document exists."""
+        if key in self._cache:
+            return True
+        return await self._backend.exists(key)
+
+    async def list_keys(self, prefix: str = "") -> list[str]:
+        """List keys from the wrapped backend."""
+        return await self._backend.list_keys(prefix)
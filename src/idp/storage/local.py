@@ -1,14 +1,23 @@
 """Local filesystem storage backend."""
 
-import json
+import asyncio
+import os
+import uuid
 from pathlib import Path
 
 from idp.core.config import Settings, get_settings
 from idp.core.exceptions import StorageError
 from idp.models.document import Document
-from idp.storage.base import StorageBackend
+from idp.storage.base import StorageBackend, register_backend
 
+# Upper bound on concurrent file writes in save_many
+_MAX_CONCURRENT_WRITES = 32
 
+# Path separators mapped to "_" in a single pass over the key
+_SANITIZE_TABLE = str.maketrans({"/": "_", "\\": "_"})
+
+
+@register_backend("local")
 class LocalStorage(StorageBackend):
     """Local filesystem storage backend."""
 
@@ -27,11 +36,39 @@ class LocalStorage(StorageBackend):
         self._base_path = Path(base_path or settings.storage_local_path)
         self._base_path.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "LocalStorage":
+        """Create local storage under settings.storage_local_path."""
+        return cls(settings=settings)
+
+    def _safe_key(self, key: str) -> str:
+        """Sanitize a key to prevent path traversal."""
+        return key.translate(_SANITIZE_TABLE)
+
     def _get_path(self, key: str) -> Path:
         """Get the file path for a key."""
-        # Sanitize key to prevent path traversal
-        safe_key = key.replace("/", "_").replace("\\", "_")
-        return self._base_path / f"{safe_key}.json"
+        return self._base_path / f"{self._safe_key(key)}.json"
+
+    def _write_atomic(self, path: Path, payload: str) -> None:
+        """Write a file via a temporary sibling and rename it into place.
+
+        Readers see either the previous file or the complete new one, never
+        a partial write.
+        """
+        # Unique per write so concurrent saves of one key don't collide
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _scan_keys(self) -> set[str]:
+        """Scan the storage directory for keys."""
+        # Read dirents directly rather than building a Path per entry
+        with os.scandir(self._base_path) as entries:
+            return {entry.name[:-5] for entry in entries if entry.name.endswith(".json")}
 
     async def save(self, document: Document) -> str:
         """Save a document to the filesystem."""
@@ -39,7 +76,7 @@ class LocalStorage(StorageBackend):
         path = self._get_path(key)
 
         try:
-            path.write_text(document.model_dump_json(indent=2))
+            await asyncio.to_thread(self._write_atomic, path, document.model_dump_json())
         except Exception as e:
             raise StorageError(
                 f"Failed to save document: {e}",
@@ -48,16 +85,45 @@ class LocalStorage(StorageBackend):
 
         return key
 
+    async def save_many(self, documents: list[Document]) -> list[str]:
+        """Save documents to the filesystem with concurrent writes."""
+        # Serialize everything up front, then overlap the writes
+        payloads = [
+            (document.id, self._get_path(document.id), document.model_dump_json())
+            for document in documents
+        ]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+        async def write(key: str, path: Path, payload: str) -> None:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self._write_atomic, path, payload)
+                except Exception as e:
+                    raise StorageError(
+                        f"Failed to save document: {e}",
+                        details={"key": key, "path": str(path)},
+                    ) from e
+
+        await asyncio.gather(*(write(*entry) for entry in payloads))
+        return [key for key, _, _ in payloads]
+
     async def load(self, key: str) -> Document | None:
         """Load a document from the filesystem."""
         path = self._get_path(key)
 
-        if not path.exists():
+        try:
+            # Raw bytes go straight to the Rust JSON parser without a str copy
+            data = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
             return None
+        except Exception as e:
+            raise StorageError(
+                f"Failed to load document: {e}",
+                details={"key": key, "path": str(path)},
+            ) from e
 
         try:
-            data = json.loads(path.read_text())
-            return Document.model_validate(data)
+            return Document.model_validate_json(data)
         except Exception as e:
             raise StorageError(
                 f"Failed to load document: {e}",
@@ -68,27 +134,22 @@ class LocalStorage(StorageBackend):
         """Delete a document from the filesystem."""
         path = self._get_path(key)
 
-        if not path.exists():
-            return False
-
         try:
-            path.unlink()
-            return True
+            await asyncio.to_thread(path.unlink)
+        except FileNotFoundError:
+            return False
         except Exception as e:
             raise StorageError(
                 f"Failed to delete document: {e}",
                 details={"key": key, "path": str(path)},
             ) from e
+        return True
 
     async def exists(self, key: str) -> bool:
-        """Check if a document exists on the filesystem."""
-        return self._get_path(key).exists()
+        """Check if a document exists in the storage directory."""
+        return await asyncio.to_thread(self._get_path(key).is_file)
 
     async def list_keys(self, prefix: str = "") -> list[str]:
         """List all document keys in the storage directory."""
-        keys = []
-        for path in self._base_path.glob("*.json"):
-            key = path.stem
-            if not prefix or key.startswith(prefix):
-                keys.append(key)
-        return sorted(keys)
+        keys = await asyncio.to_thread(self._scan_keys)
+        return sorted(key for key in keys if key.startswith(prefix))
@@ -1,11 +1,20 @@
 """In-memory storage backend for testing."""
 
+from collections.abc import Iterable
+
 from idp.models.document import Document
-from idp.storage.base import StorageBackend
+from idp.storage.base import StorageBackend, register_backend
 
 
+@register_backend("memory")
 class MemoryStorage(StorageBackend):
-    """In-memory storage backend."""
+    """In-memory storage backend.
+
+    Documents are stored and returned by reference, without copying: a
+    loaded document is the same object that was saved, so changes made to
+    it are visible to later loads. Callers that need an independent copy
+    should take one with ``model_copy``.
+    """
 
     def __init__(self) -> None:
         """Initialize memory storage."""
@@ -17,10 +26,23 @@ class MemoryStorage(StorageBackend):
         self._documents[key] = document
         return key
 
+    async def save_many(self, documents: list[Document]) -> list[str]:
+        """Save documents to memory in one bulk insert."""
+        self._documents.update((document.id, document) for document in documents)
+        return [document.id for document in documents]
+
     async def load(self, key: str) -> Document | None:
-        """Load a document from memory."""
+        """Load a document from memory (the stored instance, not a copy)."""
         return self._documents.get(key)
 
+    async def load_many(
+        self,
+        keys: list[str],
+        max_concurrency: int = 32,  # noqa: ARG002
+    ) -> list[Document | None]:
+        """Load several documents from memory."""
+        return [self._documents.get(key) for key in keys]
+
     async def delete(self, key: str) -> bool:
         """Delete a document from memory."""
         if key in self._documents:
@@ -34,9 +56,17 @@ class MemoryStorage(StorageBackend):
 
     async def list_keys(self, prefix: str = "") -> list[str]:
         """List all keys in memory."""
+        return list(self.iter_keys(prefix))
+
+    def iter_keys(self, prefix: str = "") -> Iterable[str]:
+        """Iterate keys in memory without building a list.
+
+        With no prefix this is a live view of the stored keys, so it must
+        not be held across saves or deletes.
+        """
         if prefix:
-            return [k for k in self._documents if k.startswith(prefix)]
-        return list(self._documents.keys())
+            return (k for k in self._documents if k.startswith(prefix))
+        return self._documents.keys()
 
     def clear(self) -> None:
         """Clear all documents from memory."""
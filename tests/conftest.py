@@ -3,24 +3,10 @@
 import pytest
 
 from idp.core.config import Settings
-from idp.models.document import Document, DocumentPage, DocumentType
+from idp.models.document import Document, DocumentPage
 
-
-@pytest.fixture
-def settings() -> Settings:
-    """Create test settings."""
-    return Settings(
-        environment="development",
-        debug=True,
-        log_level="DEBUG",
-        storage_backend="memory",
-    )
-
-
-@pytest.fixture
-def sample_invoice_text() -> str:
-    """Sample invoice text for testing."""
-    return """
+# Sample document texts, shared by the fixtures below
+_INVOICE_TEXT = """
     INVOICE
 
     Invoice Number: INV-2024-001
@@ -48,11 +34,7 @@ def sample_invoice_text() -> str:
     Payment Terms: Net 30
     """
 
-
-@pytest.fixture
-def sample_receipt_text() -> str:
-    """Sample receipt text for testing."""
-    return """
+_RECEIPT_TEXT = """
     COFFEE SHOP
     123 Main Street
     San Francisco, CA 94102
@@ -71,11 +53,7 @@ def sample_receipt_text() -> str:
     Thank you!
     """
 
-
-@pytest.fixture
-def sample_contract_text() -> str:
-    """Sample contract text for testing."""
-    return """
+_CONTRACT_TEXT = """
     SERVICE AGREEMENT
 
     This Agreement is entered into as of March 1, 2024
@@ -107,11 +85,7 @@ def sample_contract_text() -> str:
     Client LLC
     """
 
-
-@pytest.fixture
-def sample_form_text() -> str:
-    """Sample form text for testing."""
-    return """
+_FORM_TEXT = """
     APPLICATION FORM
 
     Date: 02/01/2024
@@ -135,35 +109,61 @@ def sample_form_text() -> str:
     """
 
 
-@pytest.fixture
-def sample_document(sample_invoice_text: str) -> Document:
-    """Create a sample document for testing."""
-    return Document(
-        id="doc-001",
-        pages=[
-            DocumentPage(
-                page_number=1,
-                content=sample_invoice_text,
-            )
-        ],
-    )
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Pin tests marked serial to one xdist worker (with --dist=loadgroup)."""
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
 
 
-@pytest.fixture
-def sample_invoice_document(sample_invoice_text: str) -> Document:
-    """Create a sample invoice document."""
-    return Document(
-        id="inv-001",
-        pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
-        document_type=DocumentType.INVOICE,
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    """Create test settings."""
+    return Settings(
+        environment="development",
+        debug=True,
+        log_level="DEBUG",
+        storage_backend="memory",
     )
 
 
+@pytest.fixture(scope="session")
+def sample_invoice_text() -> str:
+    """Sample invoice text for testing."""
+    return _INVOICE_TEXT
+
+
+@pytest.fixture(scope="session")
+def sample_receipt_text() -> str:
+    """Sample receipt text for testing."""
+    return _RECEIPT_TEXT
+
+
+@pytest.fixture(scope="session")
+def sample_contract_text() -> str:
+    """Sample contract text for testing."""
+    return _CONTRACT_TEXT
+
+
+@pytest.fixture(scope="session")
+def sample_form_text() -> str:
+    """Sample form text for testing."""
+    return _FORM_TEXT
+
+
+@pytest.fixture(scope="session")
+def invoice_page(sample_invoice_text: str) -> DocumentPage:
+    """Single invoice page, shared across tests since pages are immutable."""
+    return DocumentPage(page_number=1, content=sample_invoice_text)
+
+
+@pytest.fixture(scope="session")
+def receipt_page(sample_receipt_text: str) -> DocumentPage:
+    """Single receipt page, shared across tests since pages are immutable."""
+    return DocumentPage(page_number=1, content=sample_receipt_text)
+
+
 @pytest.fixture
-def sample_receipt_document(sample_receipt_text: str) -> Document:
-    """Create a sample receipt document."""
-    return Document(
-        id="rcpt-001",
-        pages=[DocumentPage(page_number=1, content=sample_receipt_text)],
-        document_type=DocumentType.RECEIPT,
-    )
+def sample_document(invoice_page: DocumentPage) -> Document:
+    """Sample document, built per test since documents are mutable."""
+    return Document(id="doc-001", pages=[invoice_page])
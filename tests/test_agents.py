@@ -1,14 +1,19 @@
 """Tests for agents."""
 
 import json
+import threading
+from pathlib import Path
+
 import pytest
 
 from idp.agents.base import AgentResult, BaseAgent
+from idp.agents.cache import AgentCache, content_hash
 from idp.agents.classification import (
     ClassificationAgent,
     ClassificationInput,
     ClassificationOutput,
 )
+from idp.llm.client import LLMMessage
 from idp.llm.mock.client import MockLLMClient, MockResponse, create_classification_mock
 from idp.models.document import Document, DocumentPage, DocumentType
 
@@ -41,17 +46,22 @@ class TestAgentResult:
 class TestClassificationAgent:
     """Tests for ClassificationAgent."""
 
-    @pytest.fixture
-    def mock_client(self) -> MockLLMClient:
-        """Create a mock LLM client."""
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def mock_client() -> MockLLMClient:
+        """Create a mock LLM client, shared by the class."""
         return create_classification_mock()
 
+    @pytest.fixture(autouse=True)
+    def _reset_mock_client(self, mock_client: MockLLMClient) -> None:
+        """Start each test with an empty call history."""
+        mock_client.clear_history()
+
     @pytest.fixture
     def agent(self, mock_client: MockLLMClient) -> ClassificationAgent:
         """Create classification agent with mock client."""
         return ClassificationAgent(llm_client=mock_client)
 
-    @pytest.mark.asyncio
     async def test_classify_invoice(
         self,
         agent: ClassificationAgent,
@@ -72,7 +82,6 @@ class TestClassificationAgent:
         assert result.output.confidence > 0.8
         assert "invoice" in result.output.reasoning.lower()
 
-    @pytest.mark.asyncio
     async def test_classify_receipt(
         self,
         agent: ClassificationAgent,
@@ -91,7 +100,6 @@ class TestClassificationAgent:
         assert result.output is not None
         assert result.output.document_type == DocumentType.RECEIPT
 
-    @pytest.mark.asyncio
     async def test_classify_contract(
         self,
         agent: ClassificationAgent,
@@ -110,7 +118,6 @@ class TestClassificationAgent:
         assert result.output is not None
         assert result.output.document_type == DocumentType.CONTRACT
 
-    @pytest.mark.asyncio
     async def test_classify_form(
         self,
         agent: ClassificationAgent,
@@ -129,7 +136,6 @@ class TestClassificationAgent:
         assert result.output is not None
         assert result.output.document_type == DocumentType.FORM
 
-    @pytest.mark.asyncio
     async def test_multi_page_document(
         self,
         mock_client: MockLLMClient,
@@ -154,7 +160,6 @@ class TestClassificationAgent:
         assert result.output is not None
         assert result.output.analyzed_pages == 2
 
-    @pytest.mark.asyncio
     async def test_agent_metrics(
         self,
         agent: ClassificationAgent,
@@ -174,7 +179,6 @@ class TestClassificationAgent:
         assert "agent" in result.metrics
         assert result.metrics["agent"] == "ClassificationAgent"
 
-    @pytest.mark.asyncio
     async def test_classification_output_properties(self) -> None:
         """Test ClassificationOutput properties."""
         confident = ClassificationOutput(
@@ -192,3 +196,218 @@ class TestClassificationAgent:
             analyzed_pages=1,
         )
         assert not_confident.is_confident is False
+
+    async def test_unrecognized_type_maps_to_unknown(self) -> None:
+        """Test labels outside DocumentType fall back to UNKNOWN."""
+        client = MockLLMClient(
+            default_response=MockResponse(
+                content={"document_type": "Spreadsheet", "confidence": 0.7, "reasoning": "?"}
+            )
+        )
+        agent = ClassificationAgent(llm_client=client)
+        doc = Document(id="x-001", pages=[DocumentPage(page_number=1, content="A1 B1")])
+
+        result = await agent.process(ClassificationInput(document=doc))
+
+        assert result.output is not None
+        assert result.output.document_type == DocumentType.UNKNOWN
+
+    async def test_process_many_batches_requests(self) -> None:
+        """Test several documents are classified with one LLM request."""
+        def generator(_messages: list[LLMMessage]) -> MockResponse:
+            return MockResponse(content={
+                "classifications": [
+                    {"index": 1, "document_type": "receipt", "confidence": 0.9, "reasoning": "r"},
+                    {"index": 0, "document_type": "invoice", "confidence": 0.95, "reasoning": "i"},
+                ]
+            })
+
+        client = MockLLMClient(response_generator=generator)
+        agent = ClassificationAgent(llm_client=client)
+        inputs = [
+            ClassificationInput(
+                document=Document(id=f"doc-{i}", pages=[DocumentPage(page_number=1, content=text)])
+            )
+            for i, text in enumerate(["Invoice #1", "Receipt"])
+        ]
+
+        results = await agent.process_many(inputs)
+
+        assert len(client.call_history) == 1
+        assert [r.output.document_type for r in results if r.output] == [
+            DocumentType.INVOICE,
+            DocumentType.RECEIPT,
+        ]
+        assert all(r.metrics["batch_size"] == 2 for r in results)
+
+    async def test_process_many_falls_back_for_missing(self) -> None:
+        """Test documents missing from a batched response are retried singly."""
+        client = create_classification_mock()
+        agent = ClassificationAgent(llm_client=client)
+        inputs = [
+            ClassificationInput(
+                document=Document(id=f"doc-{i}", pages=[DocumentPage(page_number=1, content=text)])
+            )
+            for i, text in enumerate(["Invoice #1", "Service agreement between parties"])
+        ]
+
+        results = await agent.process_many(inputs)
+
+        # One failed batched call, then one call per document
+        assert len(client.call_history) == 3
+        assert [r.output.document_type for r in results if r.output] == [
+            DocumentType.INVOICE,
+            DocumentType.CONTRACT,
+        ]
+
+
+class TestAgentCache:
+    """Tests for the agent output cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> AgentCache:
+        """Create a cache in a temporary directory."""
+        return AgentCache(tmp_path / "cache")
+
+    async def test_classification_cache_hit(
+        self,
+        cache: AgentCache,
+        sample_invoice_text: str,
+    ) -> None:
+        """Test a repeated document is served from the cache."""
+        client = create_classification_mock()
+        agent = ClassificationAgent(llm_client=client, cache=cache)
+        doc = Document(
+            id="inv-001",
+            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+        )
+
+        first = await agent.process(ClassificationInput(document=doc))
+        duplicate = doc.model_copy(update={"id": "inv-002"})
+        second = await agent.process(ClassificationInput(document=duplicate))
+
+        assert len(client.call_history) == 1
+        assert "cache_hit" not in first.metrics
+        assert second.metrics["cache_hit"] is True
+        assert second.output == first.output
+
+    def test_put_replaces_entry_atomically(
+        self,
+        cache: AgentCache,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test entries are written via a temp file that never lingers."""
+        cache.put("agent", "key", {"value": 1})
+        cache.put("agent", "key", {"value": 2})
+
+        namespace_dir = tmp_path / "cache" / "agent"
+        assert [p.name for p in namespace_dir.iterdir()] == ["key.json"]
+        assert cache.get("agent", "key") == {"value": 2}
+
+        def failing_replace(_src: str, _dst: str) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr("idp.agents.cache.os.replace", failing_replace)
+        cache.put("agent", "key", {"value": 3})
+
+        assert [p.name for p in namespace_dir.iterdir()] == ["key.json"]
+        assert cache.get("agent", "key") == {"value": 2}
+
+    async def test_invalid_cache_entry_evicted(
+        self,
+        cache: AgentCache,
+        sample_invoice_text: str,
+    ) -> None:
+        """Test an entry that fails revalidation is evicted and recomputed."""
+        client = create_classification_mock()
+        agent = ClassificationAgent(llm_client=client, cache=cache)
+        input_data = ClassificationInput(
+            document=Document(
+                id="inv-001",
+                pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+            )
+        )
+        key = agent._cache_key(input_data)
+        assert key is not None
+        cache.put(agent.name, key, {"document_type": "invoice", "confidence": 7.0})
+
+        result = await agent.process(input_data)
+
+        assert result.success is True
+        assert "cache_hit" not in result.metrics
+        assert len(client.call_history) == 1
+        assert cache.get(agent.name, key) == result.output.model_dump(mode="json")
+
+    async def test_process_many_uses_cache(self, cache: AgentCache) -> None:
+        """Test batched classification reads and fills the cache per document."""
+        def generator(messages: list[LLMMessage]) -> MockResponse:
+            if "=== Document" not in messages[-1].content:
+                return MockResponse(content={
+                    "document_type": "invoice", "confidence": 0.95, "reasoning": "i"
+                })
+            return MockResponse(content={
+                "classifications": [
+                    {"index": 0, "document_type": "receipt", "confidence": 0.9, "reasoning": "r"},
+                    {"index": 1, "document_type": "form", "confidence": 0.8, "reasoning": "f"},
+                ]
+            })
+
+        client = MockLLMClient(response_generator=generator)
+        agent = ClassificationAgent(llm_client=client, cache=cache)
+        inputs = [
+            ClassificationInput(
+                document=Document(id=f"doc-{i}", pages=[DocumentPage(page_number=1, content=text)])
+            )
+            for i, text in enumerate(["Invoice #1", "Receipt", "Form"])
+        ]
+        await agent.process(inputs[0])
+
+        results = await agent.process_many(inputs)
+        again = await agent.process_many(inputs)
+
+        # One single call, one batched call for the two misses, then all cached
+        assert len(client.call_history) == 2
+        assert results[0].metrics["cache_hit"] is True
+        assert [r.output.document_type for r in results if r.output] == [
+            DocumentType.INVOICE,
+            DocumentType.RECEIPT,
+            DocumentType.FORM,
+        ]
+        assert all(r.metrics["cache_hit"] is True for r in again)
+
+    async def test_cache_io_runs_off_the_event_loop(
+        self,
+        cache: AgentCache,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_invoice_text: str,
+    ) -> None:
+        """Test cache reads and writes happen in worker threads."""
+        threads: list[str] = []
+        original_get, original_put = AgentCache.get, AgentCache.put
+
+        def recording_get(self: AgentCache, *args: object) -> object:
+            threads.append(threading.current_thread().name)
+            return original_get(self, *args)  # type: ignore[arg-type]
+
+        def recording_put(self: AgentCache, *args: object, **kwargs: object) -> None:
+            threads.append(threading.current_thread().name)
+            original_put(self, *args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(AgentCache, "get", recording_get)
+        monkeypatch.setattr(AgentCache, "put", recording_put)
+        agent = ClassificationAgent(llm_client=create_classification_mock(), cache=cache)
+        doc = Document(
+            id="inv-001",
+            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+        )
+
+        await agent.process(ClassificationInput(document=doc))
+
+        assert len(threads) == 2
+        assert threading.main_thread().name not in threads
+
+    def test_content_hash_is_length_prefixed(self) -> None:
+        """Test part boundaries affect the key."""
+        assert content_hash("ab", "c") != content_hash("a", "bc")
+        assert content_hash("ab", "c") == content_hash("ab", "c")
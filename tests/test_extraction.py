@@ -2,11 +2,15 @@
 
 from datetime import date
 from decimal import Decimal
+from pathlib import Path
 
 import pytest
 
+from idp.agents.cache import AgentCache
+from idp.core.config import Settings
+from idp.core.exceptions import AgentError
 from idp.agents.extraction import ExtractionAgent, ExtractionInput, ExtractionOutput
-from idp.llm.mock.client import create_extraction_mock, MockLLMClient
+from idp.llm.mock.client import create_extraction_mock, MockLLMClient, MockResponse
 from idp.models.document import Document, DocumentPage, DocumentType
 from idp.models.extraction import InvoiceExtraction, ReceiptExtraction
 
@@ -14,17 +18,22 @@ from idp.models.extraction import InvoiceExtraction, ReceiptExtraction
 class TestExtractionAgent:
     """Tests for ExtractionAgent."""
 
-    @pytest.fixture
-    def mock_client(self) -> MockLLMClient:
-        """Create a mock LLM client for extraction."""
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def mock_client() -> MockLLMClient:
+        """Create a mock LLM client for extraction, shared by the class."""
         return create_extraction_mock()
 
+    @pytest.fixture(autouse=True)
+    def _reset_mock_client(self, mock_client: MockLLMClient) -> None:
+        """Start each test with an empty call history."""
+        mock_client.clear_history()
+
     @pytest.fixture
     def agent(self, mock_client: MockLLMClient) -> ExtractionAgent:
         """Create extraction agent with mock client."""
         return ExtractionAgent(llm_client=mock_client)
 
-    @pytest.mark.asyncio
     async def test_extract_invoice(
         self,
         agent: ExtractionAgent,
@@ -51,7 +60,6 @@ class TestExtractionAgent:
         assert extraction.total_amount == Decimal("2160")
         assert len(extraction.line_items) == 2
 
-    @pytest.mark.asyncio
     async def test_extract_receipt(
         self,
         agent: ExtractionAgent,
@@ -77,7 +85,6 @@ class TestExtractionAgent:
         assert extraction.total_amount == Decimal("9.99")
         assert extraction.payment_method == "VISA"
 
-    @pytest.mark.asyncio
     async def test_extract_contract(
         self,
         agent: ExtractionAgent,
@@ -100,7 +107,6 @@ class TestExtractionAgent:
         assert extraction.effective_date == date(2024, 3, 1)
         assert extraction.governing_law == "Delaware"
 
-    @pytest.mark.asyncio
     async def test_extract_form(
         self,
         agent: ExtractionAgent,
@@ -124,7 +130,6 @@ class TestExtractionAgent:
         assert "Name" in extraction.fields
         assert extraction.checkboxes.get("terms_agreed") is True
 
-    @pytest.mark.asyncio
     async def test_extraction_field_count(
         self,
         agent: ExtractionAgent,
@@ -143,7 +148,6 @@ class TestExtractionAgent:
         assert result.output is not None
         assert result.output.field_count > 0
 
-    @pytest.mark.asyncio
     async def test_extraction_metrics(
         self,
         agent: ExtractionAgent,
@@ -163,6 +167,66 @@ class TestExtractionAgent:
         assert "agent" in result.metrics
         assert result.metrics["agent"] == "ExtractionAgent"
 
+    async def test_extraction_cache_rebuilds_typed_output(
+        self,
+        mock_client: MockLLMClient,
+        sample_invoice_text: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test cached extractions are rebuilt into typed models."""
+        agent = ExtractionAgent(llm_client=mock_client, cache=AgentCache(tmp_path))
+        doc = Document(
+            id="inv-001",
+            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+        )
+        input_data = ExtractionInput(document=doc, document_type=DocumentType.INVOICE)
+
+        first = await agent.process(input_data)
+        second = await agent.process(input_data)
+
+        assert len(mock_client.call_history) == 1
+        assert second.metrics["cache_hit"] is True
+        assert second.output is not None
+        assert isinstance(second.output.extraction, InvoiceExtraction)
+        assert second.output == first.output
+
+    async def test_extraction_retries_with_feedback(self) -> None:
+        """Test an unparseable response is re-prompted with the error."""
+        client = MockLLMClient(
+            responses={
+                "Your output had error": MockResponse(content={"invoice_number": "INV-9"}),
+                "Extract structured data": MockResponse(content="{not json"),
+            }
+        )
+        agent = ExtractionAgent(
+            llm_client=client, settings=Settings(retry_base_delay=0.0)
+        )
+        doc = Document(id="inv-9", pages=[DocumentPage(page_number=1, content="Invoice")])
+
+        result = await agent.process(
+            ExtractionInput(document=doc, document_type=DocumentType.INVOICE)
+        )
+
+        assert result.output is not None
+        assert result.output.extraction.invoice_number == "INV-9"
+        assert len(client.call_history) == 2
+        retry_messages = client.call_history[1]["messages"]
+        assert retry_messages[1] == {"role": "assistant", "content": "{not json"}
+
+    async def test_extraction_fails_after_feedback_retries(self) -> None:
+        """Test extraction gives up once the feedback retries are exhausted."""
+        client = MockLLMClient(default_response="{not json")
+        agent = ExtractionAgent(
+            llm_client=client,
+            settings=Settings(retry_base_delay=0.0, feedback_max_retries=2),
+        )
+        doc = Document(id="inv-9", pages=[DocumentPage(page_number=1, content="Invoice")])
+
+        with pytest.raises(AgentError):
+            await agent.process(ExtractionInput(document=doc, document_type=DocumentType.INVOICE))
+
+        assert len(client.call_history) == 3
+
 
 class TestExtractionOutput:
     """Tests for ExtractionOutput."""
@@ -1,6 +1,8 @@
 """Tests for LLM clients."""
 
+import asyncio
 import json
+
 import pytest
 
 from idp.llm.client import LLMMessage, LLMResponse, MessageRole
@@ -52,11 +54,20 @@ class TestLLMResponse:
         assert d["content"] == "Test"
         assert d["total_tokens"] == 15
 
+    def test_response_data_parsed_once(self) -> None:
+        """Test JSON content is parsed on first access and then reused."""
+        resp = LLMResponse(content='{"type": "invoice"}', model="model-1")
+
+        assert resp.data == {"type": "invoice"}
+        assert resp.data is resp.data
+
+        with pytest.raises(json.JSONDecodeError):
+            _ = LLMResponse(content="not json", model="model-1").data
+
 
 class TestMockLLMClient:
     """Tests for MockLLMClient."""
 
-    @pytest.mark.asyncio
     async def test_default_response(self) -> None:
         """Test default mock response."""
         client = MockLLMClient(default_response="Default answer")
@@ -68,7 +79,6 @@ class TestMockLLMClient:
         assert response.model == "mock-model"
         assert len(client.call_history) == 1
 
-    @pytest.mark.asyncio
     async def test_pattern_matching(self) -> None:
         """Test pattern-based responses."""
         client = MockLLMClient(
@@ -79,25 +89,47 @@ class TestMockLLMClient:
             default_response="Unknown document",
         )
 
-        # Test invoice pattern
+        prompts = ("Classify this invoice", "What is this receipt?", "Something else")
+        responses = await asyncio.gather(*(
+            client.generate([LLMMessage(role=MessageRole.USER, content=prompt)])
+            for prompt in prompts
+        ))
+
+        assert [r.content for r in responses] == [
+            "This is an invoice",
+            "This is a receipt",
+            "Unknown document",
+        ]
+
+    async def test_pattern_order_wins_over_position(self) -> None:
+        """Test the first pattern in order wins, wherever it matches."""
+        client = MockLLMClient(
+            responses={
+                r"receipt": MockResponse(content="receipt"),
+                r"invoice": MockResponse(content="invoice"),
+            },
+        )
+
         response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="Classify this invoice")
+            LLMMessage(role=MessageRole.USER, content="Invoice attached\nto this receipt")
         ])
-        assert response.content == "This is an invoice"
+        assert response.content == "receipt"
 
-        # Test receipt pattern
+        client.add_response(r"attached", MockResponse(content="attached"))
         response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="What is this receipt?")
+            LLMMessage(role=MessageRole.USER, content="Invoice attached")
         ])
-        assert response.content == "This is a receipt"
+        assert response.content == "invoice"
+
+    async def test_pattern_with_inline_flags(self) -> None:
+        """Test patterns carrying their own global flags are accepted."""
+        client = MockLLMClient(responses={r"(?s)total.+due": MockResponse(content="due")})
 
-        # Test default
         response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="Something else")
+            LLMMessage(role=MessageRole.USER, content="TOTAL\nAMOUNT DUE")
         ])
-        assert response.content == "Unknown document"
+        assert response.content == "due"
 
-    @pytest.mark.asyncio
     async def test_json_response(self) -> None:
         """Test JSON response generation."""
         client = MockLLMClient(
@@ -111,11 +143,10 @@ class TestMockLLMClient:
             schema={"type": "object"},
         )
 
-        data = json.loads(response.content)
+        data = response.data
         assert data["type"] == "invoice"
         assert data["confidence"] == 0.95
 
-    @pytest.mark.asyncio
     async def test_call_history(self) -> None:
         """Test call history tracking."""
         client = MockLLMClient()
@@ -134,11 +165,20 @@ class TestMockLLMClient:
         client.clear_history()
         assert len(client.call_history) == 0
 
-    @pytest.mark.asyncio
+    async def test_call_history_disabled(self) -> None:
+        """Test calls aren't recorded when history is turned off."""
+        client = MockLLMClient(default_response="Answer", record_history=False)
+
+        response = await client.generate([LLMMessage(role=MessageRole.USER, content="First")])
+
+        assert response.content == "Answer"
+        assert client.call_history == []
+
     async def test_response_generator(self) -> None:
         """Test dynamic response generator."""
         def generator(messages: list[LLMMessage]) -> MockResponse:
-            word_count = len(messages[-1].content.split())
+            content = messages[-1].content
+            word_count = content.count(" ") + 1 if content else 0
             return MockResponse(content=f"Word count: {word_count}")
 
         client = MockLLMClient(response_generator=generator)
@@ -148,40 +188,28 @@ class TestMockLLMClient:
         ])
         assert response.content == "Word count: 3"
 
-    @pytest.mark.asyncio
     async def test_classification_mock(self) -> None:
         """Test pre-configured classification mock."""
         client = create_classification_mock()
 
-        # Test invoice classification
-        response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="Invoice #123")
-        ])
-        data = json.loads(response.content)
-        assert data["document_type"] == "invoice"
-
-        # Test receipt classification
-        response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="Receipt from merchant")
-        ])
-        data = json.loads(response.content)
-        assert data["document_type"] == "receipt"
-
-        # Test contract classification
-        response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="This Agreement between parties")
-        ])
-        data = json.loads(response.content)
-        assert data["document_type"] == "contract"
-
-        # Test form classification
-        response = await client.generate([
-            LLMMessage(role=MessageRole.USER, content="Application form with checkbox")
-        ])
-        data = json.loads(response.content)
-        assert data["document_type"] == "form"
+        prompts = (
+            "Invoice #123",
+            "Receipt from merchant",
+            "This Agreement between parties",
+            "Application form with checkbox",
+        )
+        responses = await asyncio.gather(*(
+            client.generate([LLMMessage(role=MessageRole.USER, content=prompt)])
+            for prompt in prompts
+        ))
+
+        assert [r.data["document_type"] for r in responses] == [
+            "invoice",
+            "receipt",
+            "contract",
+            "form",
+        ]
 
-    @pytest.mark.asyncio
     async def test_token_tracking(self) -> None:
         """Test token counting in responses."""
         client = MockLLMClient(
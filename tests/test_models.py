@@ -88,6 +88,21 @@ class TestDocumentModels:
 
         assert doc.get_page(99) is None
 
+    def test_document_page_views_follow_pages(self) -> None:
+        """Test cached text and page lookup are rebuilt when pages are replaced."""
+        doc = Document(id="doc-001", pages=[DocumentPage(page_number=1, content="Old")])
+        assert doc.full_text == "Old"
+        assert doc == Document(id="doc-001", pages=doc.pages, metadata=doc.metadata)
+
+        doc.pages = (DocumentPage(page_number=2, content="New"),)
+        assert doc.full_text == "New"
+        assert doc.get_page(1) is None
+        assert doc.get_page(2) is not None
+
+        copied = doc.model_copy(update={"pages": ()})
+        assert copied.full_text == ""
+        assert "_page_cache" not in doc.model_dump()
+
 
 class TestExtractionModels:
     """Tests for extraction models."""
@@ -100,6 +115,13 @@ class TestExtractionModels:
         complete = Address(city="New York", state="NY")
         assert complete.is_complete is True
 
+    def test_address_is_complete_tracks_assignment(self) -> None:
+        """Test cached completeness is refreshed when fields change."""
+        address = Address(street="123 Main St")
+        address.city = "Toronto"
+        address.country = "CA"
+        assert address.is_complete is True
+
     def test_line_item_calculate_total(self) -> None:
         """Test line item total calculation."""
         item = LineItem(
@@ -130,6 +152,12 @@ class TestExtractionModels:
         assert invoice.invoice_number == "INV-001"
         assert invoice.calculate_subtotal() == Decimal("1000")
 
+    def test_invoice_subtotal_without_line_items(self) -> None:
+        """Test an empty invoice subtotals to a Decimal zero."""
+        subtotal = InvoiceExtraction().calculate_subtotal()
+        assert isinstance(subtotal, Decimal)
+        assert subtotal == Decimal(0)
+
     def test_receipt_extraction(self) -> None:
         """Test receipt extraction model."""
         receipt = ReceiptExtraction(
@@ -175,3 +203,36 @@ class TestWorkflowModels:
         result = WorkflowResult.from_state(state)
         assert result.success is True
         assert result.metrics["step_count"] == 1
+
+    def test_workflow_state_to_soa(self) -> None:
+        """Test the column view lines up with the step list."""
+        state = WorkflowState(workflow_id="wf-001", document_id="doc-001")
+        state.add_step("classify").status = StepStatus.COMPLETED
+        state.add_step("extract")
+
+        columns = state.to_soa()
+
+        assert columns["names"] == ["classify", "extract"]
+        assert columns["statuses"] == [StepStatus.COMPLETED, StepStatus.PENDING]
+
+    def test_workflow_result_aggregate_metrics(self) -> None:
+        """Test batch-level metric aggregation."""
+        ok = WorkflowState(
+            workflow_id="wf-1", document_id="d-1", status=StepStatus.COMPLETED, duration_ns=2_000_000
+        )
+        ok.add_step("classify").status = StepStatus.COMPLETED
+        failed = WorkflowState(
+            workflow_id="wf-2", document_id="d-2", status=StepStatus.FAILED, duration_ns=4_000_000
+        )
+        failed.add_step("classify").status = StepStatus.FAILED
+
+        metrics = WorkflowResult.aggregate_metrics(
+            [WorkflowResult.from_state(ok), WorkflowResult.from_state(failed, "boom")]
+        )
+
+        assert metrics["document_count"] == 2
+        assert metrics["failed_count"] == 1
+        assert metrics["failure_rate"] == 0.5
+        assert metrics["step_count"] == 2
+        assert metrics["failed_steps"] == 1
+        assert metrics["mean_duration_ms"] == 3.0
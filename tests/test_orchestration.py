@@ -1,40 +1,48 @@
 """Tests for workflow orchestration."""
 
+from datetime import UTC
+
 import pytest
 
-from idp.llm.mock.client import MockLLMClient, MockResponse, create_classification_mock
+from idp.core.exceptions import WorkflowError
+from idp.llm.mock.client import (
+    CLASSIFICATION_RESPONSES,
+    EXTRACTION_RESPONSES,
+    MockLLMClient,
+    MockResponse,
+    create_classification_mock,
+)
 from idp.models.document import Document, DocumentPage, DocumentType
-from idp.models.workflow import StepStatus
-from idp.orchestration import WorkflowEngine, WorkflowDefinition, StepDefinition
+from idp.models.workflow import StepStatus, WorkflowResult
+from idp.orchestration import ContextFlag, WorkflowEngine, WorkflowDefinition, StepDefinition
+
+# Classification and extraction responses combined, built once per module
+ALL_RESPONSES = {**CLASSIFICATION_RESPONSES, **EXTRACTION_RESPONSES}
 
 
 class TestWorkflowEngine:
     """Tests for WorkflowEngine."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_client(self) -> MockLLMClient:
         """Create a mock LLM client configured for all steps."""
-        # Combine classification and extraction responses
-        from idp.llm.mock.client import CLASSIFICATION_RESPONSES, EXTRACTION_RESPONSES
+        # No test here inspects the calls, so don't record them
+        return MockLLMClient(responses=ALL_RESPONSES, record_history=False)
 
-        all_responses = {**CLASSIFICATION_RESPONSES, **EXTRACTION_RESPONSES}
-        return MockLLMClient(responses=all_responses)
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def engine(self, mock_client: MockLLMClient) -> WorkflowEngine:
         """Create workflow engine with mock client."""
         return WorkflowEngine(llm_client=mock_client)
 
-    @pytest.mark.asyncio
     async def test_process_invoice(
         self,
         engine: WorkflowEngine,
-        sample_invoice_text: str,
+        invoice_page: DocumentPage,
     ) -> None:
         """Test processing an invoice through the full workflow."""
         doc = Document(
             id="inv-001",
-            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+            pages=[invoice_page],
         )
 
         result = await engine.process(doc)
@@ -55,16 +63,15 @@ class TestWorkflowEngine:
         assert validate_step is not None
         assert validate_step.status == StepStatus.COMPLETED
 
-    @pytest.mark.asyncio
     async def test_process_receipt(
         self,
         engine: WorkflowEngine,
-        sample_receipt_text: str,
+        receipt_page: DocumentPage,
     ) -> None:
         """Test processing a receipt through the full workflow."""
         doc = Document(
             id="rcpt-001",
-            pages=[DocumentPage(page_number=1, content=sample_receipt_text)],
+            pages=[receipt_page],
         )
 
         result = await engine.process(doc)
@@ -72,16 +79,15 @@ class TestWorkflowEngine:
         assert result.success is True
         assert result.state.context.get("document_type") == "receipt"
 
-    @pytest.mark.asyncio
     async def test_process_with_preclassified(
         self,
         engine: WorkflowEngine,
-        sample_invoice_text: str,
+        invoice_page: DocumentPage,
     ) -> None:
         """Test processing a pre-classified document skips classification."""
         doc = Document(
             id="inv-001",
-            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+            pages=[invoice_page],
             document_type=DocumentType.INVOICE,
         )
 
@@ -99,16 +105,15 @@ class TestWorkflowEngine:
         assert extract_step is not None
         assert extract_step.status == StepStatus.COMPLETED
 
-    @pytest.mark.asyncio
     async def test_workflow_context_propagation(
         self,
         engine: WorkflowEngine,
-        sample_invoice_text: str,
+        invoice_page: DocumentPage,
     ) -> None:
         """Test that context is properly propagated between steps."""
         doc = Document(
             id="inv-001",
-            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+            pages=[invoice_page],
         )
 
         result = await engine.process(doc)
@@ -121,16 +126,15 @@ class TestWorkflowEngine:
         assert "extraction" in ctx
         assert "validation_valid" in ctx
 
-    @pytest.mark.asyncio
     async def test_workflow_updates_document(
         self,
         engine: WorkflowEngine,
-        sample_invoice_text: str,
+        invoice_page: DocumentPage,
     ) -> None:
         """Test that document is updated during processing."""
         doc = Document(
             id="inv-001",
-            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+            pages=[invoice_page],
         )
 
         await engine.process(doc)
@@ -139,16 +143,15 @@ class TestWorkflowEngine:
         assert doc.document_type is not None
         assert doc.extracted_data is not None
 
-    @pytest.mark.asyncio
     async def test_workflow_metrics(
         self,
         engine: WorkflowEngine,
-        sample_invoice_text: str,
+        invoice_page: DocumentPage,
     ) -> None:
         """Test that workflow collects metrics."""
         doc = Document(
             id="inv-001",
-            pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+            pages=[invoice_page],
         )
 
         result = await engine.process(doc)
@@ -158,22 +161,21 @@ class TestWorkflowEngine:
         assert result.metrics["step_count"] == 3
         assert result.metrics["completed_steps"] >= 2
 
-    @pytest.mark.asyncio
     async def test_process_batch(
         self,
         engine: WorkflowEngine,
-        sample_invoice_text: str,
-        sample_receipt_text: str,
+        invoice_page: DocumentPage,
+        receipt_page: DocumentPage,
     ) -> None:
         """Test batch processing multiple documents."""
         docs = [
             Document(
                 id="inv-001",
-                pages=[DocumentPage(page_number=1, content=sample_invoice_text)],
+                pages=[invoice_page],
             ),
             Document(
                 id="rcpt-001",
-                pages=[DocumentPage(page_number=1, content=sample_receipt_text)],
+                pages=[receipt_page],
             ),
         ]
 
@@ -182,6 +184,181 @@ class TestWorkflowEngine:
         assert len(results) == 2
         assert all(r.success for r in results)
 
+    async def test_process_batch_isolates_failures(
+        self,
+        engine: WorkflowEngine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a failing document doesn't abort the rest of the batch."""
+        original_process = engine.process
+
+        async def flaky_process(document: Document) -> WorkflowResult:
+            if document.id == "bad":
+                raise RuntimeError("boom")
+            return await original_process(document)
+
+        monkeypatch.setattr(engine, "process", flaky_process)
+
+        docs = [
+            Document(id=doc_id, pages=[DocumentPage(page_number=1, content="Invoice")])
+            for doc_id in ("good-1", "bad", "good-2")
+        ]
+
+        results = await engine.process_batch(docs)
+
+        assert [r.document_id for r in results] == ["good-1", "bad", "good-2"]
+        assert results[1].success is False
+        assert results[1].error == "boom"
+        assert results[1].state.completed_at is not None
+        assert results[1].state.completed_at.tzinfo is UTC
+        assert results[0].state.started_at.tzinfo is UTC
+        assert results[0].success is True
+        assert results[2].success is True
+
+    async def test_process_batch_max_concurrency(
+        self,
+        engine: WorkflowEngine,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the per-call concurrency limit bounds documents in flight."""
+        original_process = engine.process
+        in_flight = peak = 0
+
+        async def tracking_process(document: Document) -> WorkflowResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await original_process(document)
+            finally:
+                in_flight -= 1
+
+        monkeypatch.setattr(engine, "process", tracking_process)
+
+        docs = [
+            Document(id=f"doc-{i}", pages=[DocumentPage(page_number=1, content="Invoice")])
+            for i in range(6)
+        ]
+
+        results = await engine.process_batch(docs, max_concurrency=2)
+
+        assert [r.document_id for r in results] == [f"doc-{i}" for i in range(6)]
+        assert peak == 2
+
+    async def test_process_stream(
+        self,
+        engine: WorkflowEngine,
+    ) -> None:
+        """Test streaming results from a lazily produced batch."""
+        docs = (
+            Document(id=f"doc-{i}", pages=[DocumentPage(page_number=1, content="Invoice")])
+            for i in range(20)
+        )
+
+        results = [result async for result in engine.process_stream(docs)]
+
+        assert sorted(r.document_id for r in results) == sorted(f"doc-{i}" for i in range(20))
+
+    async def test_process_sets_typed_doc_type(
+        self,
+        engine: WorkflowEngine,
+    ) -> None:
+        """Test the classified type is exposed on the state as an enum."""
+        doc = Document(
+            id="inv-001",
+            pages=[DocumentPage(page_number=1, content="Invoice")],
+            document_type=DocumentType.INVOICE,
+        )
+
+        result = await engine.process(doc)
+
+        assert result.state.doc_type is DocumentType.INVOICE
+        assert result.state.context["document_type"] == "invoice"
+
+    async def test_preset_document_type_skips_classification(
+        self,
+        engine: WorkflowEngine,
+    ) -> None:
+        """Test a document typed upstream keeps its type without classification."""
+        doc = Document(
+            id="rcpt-001",
+            pages=[DocumentPage(page_number=1, content="Receipt")],
+            document_type=DocumentType.RECEIPT,
+            classification_confidence=0.9,
+        )
+
+        update = await engine._graph._classification_node({"document": doc})
+
+        assert update == {"document_type": "receipt", "classification_confidence": 0.9}
+
+    async def test_preset_document_type_without_confidence_classifies(
+        self,
+        engine: WorkflowEngine,
+        invoice_page: DocumentPage,
+    ) -> None:
+        """Test a preset type with no confidence still runs classification."""
+        doc = Document(
+            id="inv-001",
+            pages=[invoice_page],
+            document_type=DocumentType.INVOICE,
+        )
+
+        result = await engine.process(doc)
+
+        assert result.success is True
+        assert result.state.context["document_type"] == "invoice"
+        assert result.state.context["classification_confidence"] is not None
+
+    async def test_graph_binds_own_instance(
+        self,
+        mock_client: MockLLMClient,
+        invoice_page: DocumentPage,
+    ) -> None:
+        """Test each engine's graph runs its own nodes, not an earlier instance's."""
+
+        class StubRetriever:
+            async def retrieve(self, query: str) -> list[dict[str, str]]:
+                return [{"content": query}]
+
+        WorkflowEngine(llm_client=mock_client)
+        engine = WorkflowEngine(llm_client=mock_client)
+        engine._graph.bedrock_service = StubRetriever()
+
+        result = await engine.process(Document(id="inv-001", pages=[invoice_page]))
+
+        assert result.state.context["retrieved_context"] == [
+            {"content": "guidelines for invoice"}
+        ]
+
+    def test_unknown_handler_rejected(self, mock_client: MockLLMClient) -> None:
+        """Test workflows naming a missing handler fail at construction."""
+        workflow = WorkflowDefinition(
+            name="bad",
+            description="References a handler the graph doesn't have",
+            steps=[StepDefinition(name="ocr", description="OCR", handler="ocr")],
+        )
+
+        with pytest.raises(WorkflowError, match="Unknown handler 'ocr'"):
+            WorkflowEngine(llm_client=mock_client, workflow=workflow)
+
+    def test_unknown_dependency_rejected(self, mock_client: MockLLMClient) -> None:
+        """Test workflows depending on a missing step fail at construction."""
+        workflow = WorkflowDefinition(
+            name="bad",
+            description="Depends on a missing step",
+            steps=[
+                StepDefinition(
+                    name="extract",
+                    description="Extract",
+                    handler="extraction",
+                    depends_on=["classify"],
+                )
+            ],
+        )
+
+        with pytest.raises(WorkflowError, match="unknown step 'classify'"):
+            WorkflowEngine(llm_client=mock_client, workflow=workflow)
+
 
 class TestWorkflowDefinition:
     """Tests for workflow definitions."""
@@ -235,3 +412,48 @@ class TestWorkflowDefinition:
         # Condition met
         state.context = {"run_this": True}
         assert step.should_run(state) is True
+
+    @pytest.mark.parametrize(
+        ("flag", "context", "expected"),
+        [
+            (ContextFlag("run_this"), {}, False),
+            (ContextFlag("run_this", default=True), {}, True),
+            (ContextFlag("run_this"), {"run_this": False}, False),
+            (ContextFlag("run_this"), {"run_this": True}, True),
+        ],
+    )
+    def test_context_flag_condition(
+        self,
+        flag: ContextFlag,
+        context: dict[str, bool],
+        expected: bool,
+    ) -> None:
+        """Test declarative context flag conditions."""
+        from idp.models.workflow import WorkflowState
+
+        step = StepDefinition(
+            name="conditional",
+            description="Conditional step",
+            handler="handler",
+            condition=flag,
+        )
+        state = WorkflowState(workflow_id="wf-1", document_id="doc-1", context=context)
+
+        assert step.should_run(state) is expected
+
+    def test_step_conditions_read_doc_type(self) -> None:
+        """Test standard step conditions use the typed doc_type."""
+        from idp.models.workflow import WorkflowState
+        from idp.orchestration.workflows import StandardDocumentWorkflow
+
+        classify = StandardDocumentWorkflow.get_step("classify")
+        extract = StandardDocumentWorkflow.get_step("extract")
+        assert classify is not None and extract is not None
+
+        state = WorkflowState(workflow_id="wf-1", document_id="doc-1")
+        assert classify.should_run(state) is True
+        assert extract.should_run(state) is False
+
+        state.doc_type = DocumentType.RECEIPT
+        assert classify.should_run(state) is False
+        assert extract.should_run(state) is True
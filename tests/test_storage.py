@@ -0,0 +1,272 @@
+"""Tests for storage backends."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from idp.core.config import Settings
+from idp.core.exceptions import StorageError
+from idp.models.document import Document, DocumentPage, DocumentType
+from idp.storage import CachingStorage, LocalStorage, MemoryStorage, get_storage
+
+
+class TestLocalStorage:
+    """Tests for LocalStorage."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> LocalStorage:
+        """Create local storage in a temporary directory."""
+        return LocalStorage(base_path=tmp_path)
+
+    @pytest.fixture
+    def document(self) -> Document:
+        """Create a document to store."""
+        return Document(
+            id="inv-001",
+            pages=[DocumentPage(page_number=1, content="Invoice")],
+            document_type=DocumentType.INVOICE,
+        )
+
+    async def test_save_and_load(self, storage: LocalStorage, document: Document) -> None:
+        """Test a saved document loads back unchanged."""
+        key = await storage.save(document)
+
+        assert key == "inv-001"
+        assert await storage.load(key) == document
+        assert await storage.load("missing") is None
+
+    async def test_load_legacy_indented_file(
+        self,
+        tmp_path: Path,
+        document: Document,
+    ) -> None:
+        """Test files written with the old indented format still load."""
+        (tmp_path / "inv-001.json").write_text(document.model_dump_json(indent=2))
+
+        storage = LocalStorage(base_path=tmp_path)
+
+        assert await storage.load("inv-001") == document
+
+    async def test_load_corrupt_file_raises(self, storage: LocalStorage, tmp_path: Path) -> None:
+        """Test unparseable files surface as StorageError."""
+        (tmp_path / "bad.json").write_bytes(b'{"id": "bad", "pages": [')
+
+        with pytest.raises(StorageError, match="Failed to load document"):
+            await storage.load("bad")
+
+    async def test_keys_with_separators_stay_in_base_path(
+        self,
+        storage: LocalStorage,
+        tmp_path: Path,
+    ) -> None:
+        """Test path separators in keys can't escape the storage directory."""
+        await storage.save(Document(id="../a\\b", pages=[]))
+
+        assert (tmp_path / ".._a_b.json").exists()
+        assert await storage.exists("../a\\b") is True
+
+    async def test_save_replaces_without_leftovers(
+        self,
+        storage: LocalStorage,
+        document: Document,
+        tmp_path: Path,
+    ) -> None:
+        """Test saves rename into place and leave no temporary files behind."""
+        await storage.save(document)
+        updated = document.model_copy(update={"document_type": DocumentType.FORM})
+        await storage.save(updated)
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["inv-001.json"]
+        assert await storage.load("inv-001") == updated
+
+    async def test_save_many(self, storage: LocalStorage) -> None:
+        """Test saving several documents returns keys in order."""
+        docs = [Document(id=f"doc-{i}", pages=[]) for i in range(5)]
+
+        keys = await storage.save_many(docs)
+
+        assert keys == [f"doc-{i}" for i in range(5)]
+        assert await storage.list_keys() == keys
+
+    async def test_load_many(self, storage: LocalStorage) -> None:
+        """Test bulk loads keep key order and report missing keys as None."""
+        docs = [Document(id=f"doc-{i}", pages=[]) for i in range(3)]
+        await storage.save_many(docs)
+
+        loaded = await storage.load_many(["doc-2", "missing", "doc-0"], max_concurrency=2)
+
+        assert loaded == [docs[2], None, docs[0]]
+
+    async def test_exists_tracks_save_and_delete(
+        self,
+        storage: LocalStorage,
+        document: Document,
+    ) -> None:
+        """Test exists and list_keys follow saves and deletes."""
+        assert await storage.exists("inv-001") is False
+
+        await storage.save(document)
+        await storage.save(Document(id="rcpt-001", pages=[]))
+
+        assert await storage.exists("inv-001") is True
+        assert await storage.list_keys("inv") == ["inv-001"]
+
+        assert await storage.delete("inv-001") is True
+        assert await storage.delete("inv-001") is False
+        assert await storage.exists("inv-001") is False
+        assert await storage.list_keys() == ["rcpt-001"]
+
+    async def test_lists_existing_files(
+        self,
+        tmp_path: Path,
+        document: Document,
+    ) -> None:
+        """Test a new storage instance sees documents already on disk."""
+        await LocalStorage(base_path=tmp_path).save(document)
+
+        storage = LocalStorage(base_path=tmp_path)
+
+        assert await storage.exists("inv-001") is True
+        assert await storage.list_keys() == ["inv-001"]
+
+
+    async def test_sees_writes_from_other_instances(
+        self,
+        tmp_path: Path,
+        document: Document,
+    ) -> None:
+        """Test exists, delete and list_keys reflect another instance's writes."""
+        reader = LocalStorage(base_path=tmp_path)
+        assert await reader.list_keys() == []
+
+        await LocalStorage(base_path=tmp_path).save(document)
+
+        assert await reader.exists("inv-001") is True
+        assert await reader.list_keys() == ["inv-001"]
+        assert await reader.delete("inv-001") is True
+        assert not (tmp_path / "inv-001.json").exists()
+
+class TestMemoryStorage:
+    """Tests for MemoryStorage."""
+
+    async def test_load_returns_stored_instance(self) -> None:
+        """Test loads hand back the saved object without copying it."""
+        storage = MemoryStorage()
+        document = Document(id="doc-1", pages=[])
+        await storage.save(document)
+
+        assert await storage.load("doc-1") is document
+        assert (await storage.load_many(["doc-1"]))[0] is document
+
+    async def test_save_many(self) -> None:
+        """Test bulk saves store every document and keep the last duplicate."""
+        storage = MemoryStorage()
+        docs = [
+            Document(id="doc-1", pages=[]),
+            Document(id="doc-2", pages=[]),
+            Document(id="doc-1", pages=[], document_type=DocumentType.FORM),
+        ]
+
+        keys = await storage.save_many(docs)
+
+        assert keys == ["doc-1", "doc-2", "doc-1"]
+        assert await storage.list_keys() == ["doc-1", "doc-2"]
+        loaded = await storage.load("doc-1")
+        assert loaded is not None
+        assert loaded.document_type == DocumentType.FORM
+
+    async def test_iter_keys(self) -> None:
+        """Test key iteration with and without a prefix."""
+        storage = MemoryStorage()
+        await storage.save_many([Document(id=k, pages=[]) for k in ("inv-1", "rcpt-1", "inv-2")])
+
+        assert list(storage.iter_keys()) == ["inv-1", "rcpt-1", "inv-2"]
+        assert list(storage.iter_keys("inv")) == ["inv-1", "inv-2"]
+        assert await storage.list_keys("rcpt") == ["rcpt-1"]
+
+
+class TestCachingStorage:
+    """Tests for CachingStorage."""
+
+    async def test_load_served_from_cache(self) -> None:
+        """Test repeated loads hit the cache and saves invalidate it."""
+        backend = MemoryStorage()
+        storage = CachingStorage(backend, max_entries=2)
+        await storage.save(Document(id="doc-1", pages=[]))
+
+        first = await storage.load("doc-1")
+        second = await storage.load("doc-1")
+
+        assert first == second
+        assert first is not second
+        assert storage.hits == 1
+        assert storage.misses == 1
+
+        await storage.save(Document(id="doc-1", pages=[], document_type=DocumentType.FORM))
+        reloaded = await storage.load("doc-1")
+        assert reloaded is not None
+        assert reloaded.document_type == DocumentType.FORM
+        assert storage.misses == 2
+
+    async def test_evicts_least_recently_used(self) -> None:
+        """Test the cache holds at most max_entries documents."""
+        storage = CachingStorage(MemoryStorage(), max_entries=2)
+        await storage.save_many([Document(id=f"doc-{i}", pages=[]) for i in range(3)])
+
+        for key in ("doc-0", "doc-1", "doc-2", "doc-0"):
+            await storage.load(key)
+
+        assert storage.hits == 0
+        assert storage.hit_rate == 0.0
+
+    async def test_delete_invalidates(self) -> None:
+        """Test deleted documents are no longer served."""
+        storage = CachingStorage(MemoryStorage())
+        await storage.save(Document(id="doc-1", pages=[]))
+        await storage.load("doc-1")
+
+        assert await storage.delete("doc-1") is True
+        assert await storage.load("doc-1") is None
+        assert await storage.exists("doc-1") is False
+
+    async def test_write_during_load_not_cached(self) -> None:
+        """Test a load that overlaps a save doesn't cache the stale document."""
+        release = asyncio.Event()
+
+        class SlowStorage(MemoryStorage):
+            async def load(self, key: str) -> Document | None:
+                document = await super().load(key)
+                await release.wait()
+                return document
+
+        storage = CachingStorage(SlowStorage())
+        await storage.save(Document(id="doc-1", pages=[]))
+
+        pending = asyncio.create_task(storage.load("doc-1"))
+        await asyncio.sleep(0)
+        await storage.save(Document(id="doc-1", pages=[], document_type=DocumentType.FORM))
+        release.set()
+        await pending
+
+        reloaded = await storage.load("doc-1")
+        assert reloaded is not None
+        assert reloaded.document_type == DocumentType.FORM
+
+
+class TestGetStorage:
+    """Tests for storage backend selection."""
+
+    def test_selects_backend_from_settings(self, tmp_path: Path) -> None:
+        """Test the configured backend name resolves to its class."""
+        assert isinstance(get_storage(Settings(storage_backend="memory")), MemoryStorage)
+
+        local = get_storage(
+            Settings(storage_backend="local", storage_local_path=str(tmp_path))
+        )
+        assert isinstance(local, LocalStorage)
+
+    def test_unregistered_backend(self) -> None:
+        """Test selecting a backend with no implementation fails clearly."""
+        with pytest.raises(StorageError, match="Unknown storage backend 's3'"):
+            get_storage(Settings(storage_backend="s3"))
@@ -1,6 +1,7 @@
 """Tests for validation agent."""
 
-from datetime import date
+import json
+from datetime import date, datetime
 from decimal import Decimal
 
 import pytest
@@ -16,10 +17,11 @@ from idp.agents.validation import (
 from idp.agents.validation.rules import (
     RequiredFieldRule,
     DateOrderRule,
+    LineItemsTotalRule,
     PositiveAmountRule,
     TotalMatchesSubtotalPlusTaxRule,
 )
-from idp.models.document import Document, DocumentPage, DocumentType
+from idp.models.document import Document, DocumentType
 from idp.models.extraction import InvoiceExtraction, ReceiptExtraction, LineItem
 
 
@@ -52,6 +54,27 @@ class TestValidationIssue:
         assert d["severity"] == "warning"
         assert d["actual"] == 50000
 
+    def test_issue_severity_from_string(self) -> None:
+        """Test a string severity is coerced to the enum."""
+        issue = ValidationIssue(field="x", message="m", rule="r", severity="warning")
+        assert issue.severity is IssueSeverity.WARNING
+        assert issue.to_dict()["severity"] == "warning"
+
+        output = ValidationOutput(valid=True, issues=[issue])
+        assert output.to_dict()["issues"][0]["severity"] == "warning"
+        assert json.loads(output.to_json())["issues"][0]["severity"] == "warning"
+
+        with pytest.raises(ValueError):
+            ValidationIssue(field="x", message="m", rule="r", severity="fatal")
+
+    def test_issue_is_immutable(self) -> None:
+        """Test issues are frozen and carry no per-instance dict."""
+        issue = ValidationIssue(field="amount", message="Amount seems high", rule="amount_range")
+
+        with pytest.raises(AttributeError):
+            issue.field = "total"  # type: ignore[misc]
+        assert not hasattr(issue, "__dict__")
+
 
 class TestValidationOutput:
     """Tests for ValidationOutput model."""
@@ -76,6 +99,31 @@ class TestValidationOutput:
         assert output.warning_count == 1
         assert output.info_count == 1
 
+    def test_counts_follow_issue_list(self) -> None:
+        """Test counts follow direct edits, replaced lists and copies."""
+        output = ValidationOutput(valid=False)
+        output.add_issue(ValidationIssue(field="f1", message="Error 1", rule="r1"))
+        assert output.error_count == 1
+
+        copied = output.model_copy()
+        output.issues.append(ValidationIssue(field="f2", message="Error 2", rule="r2"))
+        assert output.error_count == 2
+        assert copied.error_count == 2
+
+        output.issues = [
+            ValidationIssue(field="f3", severity=IssueSeverity.INFO, message="Info", rule="r3")
+        ]
+        assert output.error_count == 0
+        assert output.info_count == 1
+        assert copied.error_count == 2
+
+        copied.issues[0] = output.issues[0]
+        copied.issues.pop()
+        copied.issues.append(output.issues[0])
+        assert copied.error_count == 0
+        assert copied.info_count == 2
+        assert copied.to_dict()["info_count"] == 2
+
     def test_get_issues_by_field(self) -> None:
         """Test filtering issues by field."""
         output = ValidationOutput(valid=False, rules_checked=2, rules_passed=0)
@@ -92,6 +140,45 @@ class TestValidationOutput:
         amount_issues = output.get_issues_by_field("amount")
         assert len(amount_issues) == 2
 
+    def test_get_issues_by_field_after_append(self) -> None:
+        """Test field lookups keep insertion order and follow edits to the list."""
+        output = ValidationOutput(valid=False)
+        first = ValidationIssue(field="amount", message="E1", rule="r1")
+        output.add_issue(first)
+        assert output.get_issues_by_field("amount") == [first]
+
+        output.get_issues_by_field("amount").clear()
+        second = ValidationIssue(field="amount", message="E2", rule="r2")
+        output.add_issue(second)
+
+        assert output.get_issues_by_field("amount") == [first, second]
+        assert output.get_issues_by_field("date") == []
+
+        date_issue = ValidationIssue(field="date", message="W1", rule="r3")
+        output.issues[0] = date_issue
+        output.issues.pop()
+        output.issues.append(first)
+        assert output.get_issues_by_field("date") == [date_issue]
+        assert output.get_issues_by_field("amount") == [first]
+
+    def test_to_json(self) -> None:
+        """Test JSON output matches to_dict with amounts and dates encoded."""
+        output = ValidationOutput(valid=False, rules_checked=1, rules_passed=0)
+        output.add_issue(ValidationIssue(
+            field="total_amount",
+            message="Negative total",
+            rule="positive_amount_total_amount",
+            expected=date(2024, 1, 1),
+            actual=Decimal("-100"),
+        ))
+
+        data = json.loads(output.to_json())
+
+        assert data["error_count"] == 1
+        assert data["issues"][0]["severity"] == "error"
+        assert data["issues"][0]["expected"] == "2024-01-01"
+        assert data["issues"][0]["actual"] == "-100"
+
 
 class TestValidationRules:
     """Tests for individual validation rules."""
@@ -116,6 +203,16 @@ class TestValidationRules:
 
         assert len(issues) == 0
 
+    def test_required_field_rule_unknown_field(self) -> None:
+        """Test a field the extraction doesn't define counts as missing."""
+        rule = RequiredFieldRule("merchant_name")
+
+        issues = rule.validate(InvoiceExtraction())
+
+        assert len(issues) == 1
+        assert issues[0].actual is None
+        assert issues[0].message == "Required field 'merchant_name' is missing or empty"
+
     def test_date_order_rule_valid(self) -> None:
         """Test date order rule with valid order."""
         rule = DateOrderRule("invoice_date", "due_date", [DocumentType.INVOICE])
@@ -141,6 +238,37 @@ class TestValidationRules:
         assert len(issues) == 1
         assert "must be before" in issues[0].message
 
+    def test_date_order_rule_batch(self) -> None:
+        """Test batch date checks match per-extraction validation."""
+        rule = DateOrderRule("invoice_date", "due_date", [DocumentType.INVOICE])
+        extractions = [
+            InvoiceExtraction(invoice_date=date(2024, 3, 1), due_date=date(2024, 1, 1)),
+            InvoiceExtraction(invoice_date=date(2024, 1, 1), due_date=date(2024, 2, 1)),
+            InvoiceExtraction(invoice_date=date(2024, 1, 1)),
+        ]
+
+        batch = rule.validate_batch(extractions)
+
+        assert [len(issues) for issues in batch] == [1, 0, 0]
+        assert batch == [rule.validate(e) for e in extractions]
+
+    def test_date_order_rule_batch_matches_validate_on_odd_values(self) -> None:
+        """Test batch and per-extraction checks agree on non-date values."""
+        rule = DateOrderRule("invoice_date", "due_date", [DocumentType.INVOICE])
+        # Bypass validation to get values the extraction model would coerce
+        not_a_date = InvoiceExtraction.model_construct(
+            invoice_date="2024-03-01", due_date=date(2024, 1, 1)
+        )
+        mixed = InvoiceExtraction.model_construct(
+            invoice_date=datetime(2024, 3, 1, 12, 0), due_date=date(2024, 1, 1)
+        )
+
+        assert rule.validate_batch([not_a_date]) == [rule.validate(not_a_date)] == [[]]
+        with pytest.raises(TypeError):
+            rule.validate(mixed)
+        with pytest.raises(TypeError):
+            rule.validate_batch([mixed])
+
     def test_positive_amount_rule_valid(self) -> None:
         """Test positive amount rule with valid amount."""
         rule = PositiveAmountRule("total_amount", [DocumentType.INVOICE])
@@ -187,24 +315,48 @@ class TestValidationRules:
         assert len(issues) == 1
         assert "does not match" in issues[0].message
 
+    def test_line_items_total(self) -> None:
+        """Test line item sums are compared against the subtotal."""
+        rule = LineItemsTotalRule()
+        items = [
+            LineItem(description="A", quantity=Decimal("2"), unit_price=Decimal("25")),
+            LineItem(description="B", total=Decimal("50")),
+            LineItem(description="No amounts"),
+        ]
+
+        assert rule.validate(InvoiceExtraction(line_items=items, subtotal=Decimal("100"))) == []
+
+        issues = rule.validate(InvoiceExtraction(line_items=items, subtotal=Decimal("90")))
+        assert len(issues) == 1
+        assert issues[0].actual == 100.0
+
+
+class TestValidationRuleRegistry:
+    """Tests for ValidationRuleRegistry."""
+
+    def test_get_rules_tracks_registration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test per-type rule lookups pick up newly registered rules."""
+        registry = ValidationRuleRegistry()
+        monkeypatch.setattr(registry, "_rules", list(registry._rules))
+        monkeypatch.setattr(registry, "_by_type", {})
+
+        before = registry.get_rules(DocumentType.FORM)
+        rule = RequiredFieldRule("form_title", [DocumentType.FORM])
+        registry.register(rule)
+
+        assert registry.get_rules(DocumentType.FORM) == [*before, rule]
+        assert rule not in registry.get_rules(DocumentType.INVOICE)
+
 
 class TestValidationAgent:
     """Tests for ValidationAgent."""
 
-    @pytest.fixture
-    def agent(self) -> ValidationAgent:
-        """Create validation agent."""
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def agent() -> ValidationAgent:
+        """Create validation agent, shared by the class."""
         return ValidationAgent()
 
-    @pytest.fixture
-    def sample_document(self) -> Document:
-        """Create a sample document."""
-        return Document(
-            id="doc-001",
-            pages=[DocumentPage(page_number=1, content="Test content")],
-        )
-
-    @pytest.mark.asyncio
     async def test_validate_valid_invoice(
         self, agent: ValidationAgent, sample_document: Document
     ) -> None:
@@ -230,7 +382,6 @@ class TestValidationAgent:
         assert result.output.valid is True
         assert result.output.error_count == 0
 
-    @pytest.mark.asyncio
     async def test_validate_invalid_invoice(
         self, agent: ValidationAgent, sample_document: Document
     ) -> None:
@@ -254,7 +405,6 @@ class TestValidationAgent:
         assert result.output.valid is False  # But validation failed
         assert result.output.error_count >= 2  # Multiple errors
 
-    @pytest.mark.asyncio
     async def test_validate_receipt(
         self, agent: ValidationAgent, sample_document: Document
     ) -> None:
@@ -278,7 +428,6 @@ class TestValidationAgent:
         assert result.output is not None
         assert result.output.valid is True
 
-    @pytest.mark.asyncio
     async def test_strict_mode(
         self, agent: ValidationAgent, sample_document: Document
     ) -> None:
@@ -303,7 +452,6 @@ class TestValidationAgent:
         # In strict mode, warning causes failure
         assert result.output.valid is False
 
-    @pytest.mark.asyncio
     async def test_agent_metrics(
         self, agent: ValidationAgent, sample_document: Document
     ) -> None:
@@ -320,3 +468,89 @@ class TestValidationAgent:
         assert result.success is True
         assert "duration_ms" in result.metrics
         assert result.metrics["agent"] == "ValidationAgent"
+
+    async def test_no_applicable_rules(
+        self, agent: ValidationAgent, sample_document: Document
+    ) -> None:
+        """Test document types without rules pass without running any."""
+        input_data = ValidationInput(
+            document=sample_document,
+            document_type=DocumentType.FORM,
+            extraction=InvoiceExtraction(),
+        )
+
+        result = await agent.process(input_data)
+
+        assert result.output is not None
+        assert result.output.valid is True
+        assert result.output.rules_checked == 0
+
+    async def test_process_many_matches_process(
+        self,
+        agent: ValidationAgent,
+        sample_document: Document,
+    ) -> None:
+        """Test batch validation gives the same outputs as per-document calls."""
+        inputs = [
+            ValidationInput(
+                document=sample_document,
+                document_type=DocumentType.INVOICE,
+                extraction=InvoiceExtraction(
+                    invoice_number="INV-001",
+                    subtotal=Decimal("100"),
+                    tax_amount=Decimal("10"),
+                    total_amount=Decimal("115"),
+                ),
+                strict_mode=True,
+            ),
+            ValidationInput(
+                document=sample_document,
+                document_type=DocumentType.RECEIPT,
+                extraction=ReceiptExtraction(merchant_name="Coffee Shop"),
+            ),
+            ValidationInput(
+                document=sample_document,
+                document_type=DocumentType.INVOICE,
+                extraction=InvoiceExtraction(total_amount=Decimal("-1")),
+            ),
+        ]
+
+        batch = await agent.process_many(inputs)
+        single = [await agent.process(input_data) for input_data in inputs]
+
+        assert [r.output for r in batch] == [r.output for r in single]
+        assert [r.output.valid for r in batch if r.output] == [False, False, False]
+        assert batch[0].metrics["batch_size"] == 3
+
+    async def test_offloaded_rules_run_in_threads(
+        self,
+        sample_document: Document,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test rules marked for offloading run off the event loop thread."""
+        import threading
+
+        class BlockingRule(RequiredFieldRule):
+            offload = True
+
+            def validate(self, extraction: InvoiceExtraction) -> list[ValidationIssue]:
+                threads.append(threading.current_thread())
+                return super().validate(extraction)
+
+        threads: list[threading.Thread] = []
+        registry = ValidationRuleRegistry()
+        monkeypatch.setattr(registry, "_rules", [BlockingRule("invoice_number")])
+        monkeypatch.setattr(registry, "_by_type", {})
+        agent = ValidationAgent()
+
+        result = await agent.process(
+            ValidationInput(
+                document=sample_document,
+                document_type=DocumentType.INVOICE,
+                extraction=InvoiceExtraction(invoice_number=None),
+            )
+        )
+
+        assert threads and threads[0] is not threading.main_thread()
+        assert result.output is not None
+        assert [i.rule for i in result.output.issues] == ["required_invoice_number"]